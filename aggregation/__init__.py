@@ -1,6 +1,6 @@
 """Aggregation Package for OHLC Candle Building."""
 
-from .models import Tick, OHLCCandle
+from .models import Tick, OHLCCandle, normalize_symbol
 from .ohlc_aggregator import OHLCAggregator
 
-__all__ = ["Tick", "OHLCCandle", "OHLCAggregator"]
+__all__ = ["Tick", "OHLCCandle", "OHLCAggregator", "normalize_symbol"]
@@ -5,13 +5,64 @@ This module defines the core data structures used throughout the trading system
 for representing market data ticks and OHLC candles.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
-import json
+from functools import lru_cache
+from typing import Dict, Optional
+import sys
+import orjson
 
 
-@dataclass
+# Canonical (upper-cased, interned) form of each raw symbol spelling seen
+_SYMBOL_CACHE: Dict[str, str] = {}
+_SYMBOL_CACHE_MAX = 1024
+
+# Free-list of recycled Tick instances (see Tick.acquire / Tick.release).
+# deque.append() and deque.pop() are atomic in CPython, so no lock is needed.
+_TICK_POOL: deque = deque(maxlen=4096)
+
+
+def normalize_symbol(symbol: str) -> str:
+    """
+    Get the canonical upper-case form of a trading symbol.
+    
+    Results are interned and cached, so repeat lookups return the same
+    string object without allocating.
+    
+    Args:
+        symbol: Trading symbol in any case (e.g., 'btcusdt')
+        
+    Returns:
+        Upper-cased, interned symbol (e.g., 'BTCUSDT')
+    """
+    normalized = _SYMBOL_CACHE.get(symbol)
+    if normalized is None:
+        normalized = sys.intern(symbol.upper())
+        if len(_SYMBOL_CACHE) < _SYMBOL_CACHE_MAX:
+            _SYMBOL_CACHE[symbol] = normalized
+    return normalized
+
+
+@lru_cache(maxsize=4096)
+def _minute_isoformat(ts_minute: int) -> str:
+    """
+    Get the ISO-8601 string for a candle's start minute.
+    
+    Every symbol's candle for a given minute, and every re-serialization of
+    the same historical candle, shares one cached string instead of building
+    a datetime and formatting it per call.
+    
+    Args:
+        ts_minute: Whole minutes since the epoch (UTC)
+        
+    Returns:
+        ISO-8601 timestamp (e.g., '2023-11-14T22:13:00')
+    """
+    return datetime.utcfromtimestamp(ts_minute * 60).isoformat()
+
+
+@dataclass(slots=True)
 class Tick:
     """
     Represents a single trade/tick from the market.
@@ -20,15 +71,20 @@ class Tick:
         symbol: Trading pair symbol (e.g., 'BTCUSDT')
         price: Trade price
         quantity: Trade quantity
-        timestamp: UTC timestamp of the trade
+        timestamp_ms: UTC trade time in milliseconds since the epoch
         trade_id: Unique trade identifier from exchange
     """
     symbol: str
     price: float
     quantity: float
-    timestamp: datetime
+    timestamp_ms: int
     trade_id: Optional[int] = None
     
+    @property
+    def timestamp(self) -> datetime:
+        """UTC timestamp of the trade."""
+        return datetime.utcfromtimestamp(self.timestamp_ms / 1000)
+    
     def to_dict(self) -> dict:
         """Convert tick to dictionary for JSON serialization."""
         return {
@@ -39,6 +95,65 @@ class Tick:
             "trade_id": self.trade_id
         }
     
+    @classmethod
+    def acquire(
+        cls,
+        symbol: str,
+        price: float,
+        quantity: float,
+        timestamp_ms: int,
+        trade_id: Optional[int] = None
+    ) -> "Tick":
+        """
+        Get a Tick from the pool, allocating a new one if the pool is empty.
+        
+        Args:
+            symbol: Trading pair symbol
+            price: Trade price
+            quantity: Trade quantity
+            timestamp_ms: UTC trade time in milliseconds since the epoch
+            trade_id: Unique trade identifier from exchange
+            
+        Returns:
+            Tick instance populated with the given fields
+        """
+        try:
+            tick = _TICK_POOL.pop()
+        except IndexError:
+            return cls(symbol, price, quantity, timestamp_ms, trade_id)
+        
+        tick.symbol = symbol
+        tick.price = price
+        tick.quantity = quantity
+        tick.timestamp_ms = timestamp_ms
+        tick.trade_id = trade_id
+        return tick
+    
+    @classmethod
+    def preallocate(cls, count: int) -> None:
+        """
+        Fill the tick pool ahead of time.
+        
+        Moves allocation of the first ticks to startup so the first
+        messages after connecting do not pay for it.
+        
+        Args:
+            count: Number of ticks to add (capped by the pool size)
+        """
+        count = min(count, _TICK_POOL.maxlen - len(_TICK_POOL))
+        for _ in range(count):
+            _TICK_POOL.append(cls("", 0.0, 0.0, 0))
+    
+    def release(self) -> None:
+        """
+        Return this tick to the pool for reuse.
+        
+        The tick must not be referenced after release; consumers that need
+        to keep tick data should copy the fields they need.
+        """
+        self.trade_id = None
+        _TICK_POOL.append(self)
+    
     @classmethod
     def from_binance_message(cls, symbol: str, data: dict) -> "Tick":
         """
@@ -49,7 +164,11 @@ class Tick:
             data: Raw message data from Binance WebSocket
             
         Returns:
-            Tick instance
+            Tick instance (drawn from the tick pool)
+            
+        Raises:
+            KeyError: If a required trade field is missing
+            ValueError: If a price, quantity or time field is not numeric
         """
         # Binance trade message format:
         # {
@@ -62,27 +181,28 @@ class Tick:
         #   "T": 123456785,  # Trade time
         #   ...
         # }
-        return cls(
-            symbol=symbol.upper(),
-            price=float(data.get("p", 0)),
-            quantity=float(data.get("q", 0)),
-            timestamp=datetime.utcfromtimestamp(data.get("T", 0) / 1000),
-            trade_id=data.get("t")
+        # Positional arguments: this runs once per trade on the ingest path
+        return cls.acquire(
+            normalize_symbol(symbol),
+            float(data["p"]),
+            float(data["q"]),
+            int(data["T"]),
+            data.get("t")
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OHLCCandle:
     """
     Represents a 1-minute OHLC (Open, High, Low, Close) candle.
     
     Attributes:
-        symbol: Trading pair symbol
+        symbol: Trading pair symbol, normalized (see normalize_symbol)
         open: Opening price of the candle
         high: Highest price during the candle period
         low: Lowest price during the candle period
         close: Closing price of the candle
-        timestamp: UTC timestamp of candle start (minute boundary)
+        ts_minute: Candle start as whole minutes since the epoch (UTC)
         volume: Total traded volume (optional)
         tick_count: Number of ticks in this candle (optional)
         is_closed: Whether the candle is finalized
@@ -92,10 +212,17 @@ class OHLCCandle:
     high: float
     low: float
     close: float
-    timestamp: datetime
+    ts_minute: int
     volume: float = 0.0
     tick_count: int = 0
     is_closed: bool = False
+    # Encoded JSON, kept once the candle is closed and can no longer change
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """UTC timestamp of candle start (minute boundary)."""
+        return datetime.utcfromtimestamp(self.ts_minute * 60)
     
     def to_dict(self) -> dict:
         """Convert candle to dictionary for JSON serialization."""
@@ -105,7 +232,7 @@ class OHLCCandle:
             "high": self.high,
             "low": self.low,
             "close": self.close,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _minute_isoformat(self.ts_minute),
             "volume": self.volume,
             "tick_count": self.tick_count,
             "is_closed": self.is_closed
@@ -113,7 +240,22 @@ class OHLCCandle:
     
     def to_json(self) -> str:
         """Convert candle to JSON string."""
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode("utf-8")
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Convert candle to UTF-8 encoded JSON bytes.
+        
+        Closed candles are encoded once; later calls return the same bytes,
+        so history can be embedded in responses via orjson.Fragment without
+        rebuilding a dict per candle.
+        """
+        if self._json is not None:
+            return self._json
+        data = orjson.dumps(self.to_dict())
+        if self.is_closed:
+            self._json = data
+        return data
     
     def update(self, tick: Tick) -> None:
         """
@@ -123,31 +265,47 @@ class OHLCCandle:
             tick: New tick to incorporate into the candle
         """
         if not self.is_closed:
-            self.high = max(self.high, tick.price)
-            self.low = min(self.low, tick.price)
-            self.close = tick.price
-            self.volume += tick.quantity
-            self.tick_count += 1
+            self.add_trade(tick.price, tick.quantity)
+    
+    def add_trade(self, price: float, quantity: float) -> None:
+        """
+        Fold a single trade into the candle.
+        
+        Scalar form of update() for the per-tick hot path; callers are
+        responsible for checking that the candle is still open.
+        
+        Args:
+            price: Trade price
+            quantity: Trade quantity
+        """
+        # A new high cannot also be a new low, so skip the second compare
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += quantity
+        self.tick_count += 1
     
     @classmethod
-    def from_tick(cls, tick: Tick, candle_timestamp: datetime) -> "OHLCCandle":
+    def from_tick(cls, tick: Tick, ts_minute: int) -> "OHLCCandle":
         """
         Create a new candle from the first tick.
         
         Args:
             tick: The first tick of the candle
-            candle_timestamp: The minute-boundary timestamp for this candle
+            ts_minute: The minute (since the epoch) this candle covers
             
         Returns:
             New OHLCCandle instance
         """
         return cls(
-            symbol=tick.symbol,
+            symbol=normalize_symbol(tick.symbol),
             open=tick.price,
             high=tick.price,
             low=tick.price,
             close=tick.price,
-            timestamp=candle_timestamp,
+            ts_minute=ts_minute,
             volume=tick.quantity,
             tick_count=1,
             is_closed=False
@@ -6,17 +6,23 @@ ensuring proper minute-boundary closing and maintaining rolling history.
 """
 
 import asyncio
+import heapq
 import threading
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+from typing import Deque, Dict, Iterable, List, Optional, Callable, Tuple
 import logging
 
-from aggregation.models import Tick, OHLCCandle
+from aggregation.models import Tick, OHLCCandle, normalize_symbol
 from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Number of lock shards symbols are spread over (must be a power of two)
+_LOCK_SHARDS = 16
+
 
 class OHLCAggregator:
     """
@@ -27,9 +33,11 @@ class OHLCAggregator:
     
     Attributes:
         _current_candles: Dict mapping symbols to their current (building) candle
-        _history: Dict mapping symbols to their list of finalized candles
-        _lock: Threading lock for thread-safe access
-        _candle_callbacks: List of callbacks to notify on candle close
+        _history: Dict mapping symbols to a bounded deque of finalized candles
+        _locks: Lock shards; each symbol is guarded by one shard
+        _expiry_heap: Min-heap of (ts_minute, symbol) for every candle started
+        _symbol_locks: Lock shard of each pre-registered canonical symbol
+        _candle_callbacks: Tuple of callbacks to notify on candle close
     """
     
     def __init__(self, history_size: Optional[int] = None):
@@ -43,9 +51,15 @@ class OHLCAggregator:
         self._history_size = history_size or self.settings.candle_history_size
         
         self._current_candles: Dict[str, OHLCCandle] = {}
-        self._history: Dict[str, List[OHLCCandle]] = defaultdict(list)
-        self._lock = threading.RLock()
-        self._candle_callbacks: List[Callable[[OHLCCandle], None]] = []
+        self._history: Dict[str, Deque[OHLCCandle]] = defaultdict(
+            lambda: deque(maxlen=self._history_size)
+        )
+        self._locks = tuple(threading.RLock() for _ in range(_LOCK_SHARDS))
+        self._expiry_heap: List[Tuple[int, str]] = []
+        # Guards the heap across shards; taken once per new candle only
+        self._expiry_lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.RLock] = {}
+        self._candle_callbacks: Tuple[Callable[[OHLCCandle], None], ...] = ()
         self._running = False
         self._boundary_task: Optional[asyncio.Task] = None
     
@@ -56,7 +70,7 @@ class OHLCAggregator:
         Args:
             callback: Function to call with each closed candle
         """
-        self._candle_callbacks.append(callback)
+        self._candle_callbacks += (callback,)
     
     def remove_candle_callback(self, callback: Callable[[OHLCCandle], None]) -> None:
         """
@@ -65,20 +79,58 @@ class OHLCAggregator:
         Args:
             callback: Function to remove from callbacks
         """
-        if callback in self._candle_callbacks:
-            self._candle_callbacks.remove(callback)
+        self._candle_callbacks = tuple(
+            cb for cb in self._candle_callbacks if cb != callback
+        )
+    
+    def register_symbols(self, symbols: Iterable[str]) -> None:
+        """
+        Pre-register the subscribed symbol universe.
+        
+        Ticks for registered symbols skip normalization and shard hashing
+        in process_tick(); anything else still takes the dynamic path.
+        
+        Args:
+            symbols: Trading symbols in any case
+        """
+        # Copy-on-write so readers on the tick path never see a resize
+        symbol_locks = dict(self._symbol_locks)
+        for symbol in symbols:
+            symbol = normalize_symbol(symbol)
+            symbol_locks[symbol] = self._lock_for(symbol)
+        self._symbol_locks = symbol_locks
+    
+    def _lock_for(self, symbol: str) -> threading.RLock:
+        """
+        Get the lock shard guarding a symbol.
+        
+        Args:
+            symbol: Normalized trading symbol
+            
+        Returns:
+            The RLock for the symbol's shard
+        """
+        return self._locks[hash(symbol) & (_LOCK_SHARDS - 1)]
+    
+    @contextmanager
+    def _all_locks(self):
+        """Hold every lock shard (always acquired in the same order)."""
+        with ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            yield
     
-    def _get_candle_timestamp(self, tick_time: datetime) -> datetime:
+    def _get_candle_minute(self, timestamp_ms: int) -> int:
         """
-        Get the minute-boundary timestamp for a tick.
+        Get the minute bucket for a tick.
         
         Args:
-            tick_time: The tick's timestamp
+            timestamp_ms: The tick's timestamp in epoch milliseconds
             
         Returns:
-            Datetime floored to the minute
+            Whole minutes since the epoch
         """
-        return tick_time.replace(second=0, microsecond=0)
+        return timestamp_ms // 60000
     
     def process_tick(self, tick: Tick) -> Optional[OHLCCandle]:
         """
@@ -90,35 +142,94 @@ class OHLCAggregator:
         Returns:
             Closed candle if a candle was finalized, None otherwise
         """
-        with self._lock:
-            symbol = tick.symbol.upper()
-            candle_timestamp = self._get_candle_timestamp(tick.timestamp)
+        symbol = tick.symbol
+        lock = self._symbol_locks.get(symbol)
+        if lock is None:
+            symbol = normalize_symbol(symbol)
+            lock = self._lock_for(symbol)
+        with lock:
+            return self._apply_tick(symbol, tick)
+    
+    def _apply_tick(self, symbol: str, tick: Tick) -> Optional[OHLCCandle]:
+        """
+        Fold a tick into its symbol's current candle.
+        
+        Must be called with the symbol's lock shard held.
+        
+        Args:
+            symbol: Normalized symbol of the tick
+            tick: The incoming tick
             
-            current_candle = self._current_candles.get(symbol)
-            closed_candle = None
+        Returns:
+            Closed candle if a candle was finalized, None otherwise
+        """
+        ts_minute = self._get_candle_minute(tick.timestamp_ms)
+        
+        # Subscript rather than .get(): after the first tick of a minute the
+        # candle is almost always present, so the KeyError path is rare
+        try:
+            current_candle = self._current_candles[symbol]
+        except KeyError:
+            # No current candle, create a new one
+            self._start_candle(symbol, tick, ts_minute)
+            return None
+        
+        closed_candle = None
+        
+        if current_candle.ts_minute < ts_minute:
+            # Current candle is from a previous minute, close it
+            closed_candle = self._close_candle(symbol)
             
-            if current_candle is None:
-                # No current candle, create a new one
-                self._current_candles[symbol] = OHLCCandle.from_tick(tick, candle_timestamp)
-                logger.debug(f"Started new candle for {symbol} at {candle_timestamp}")
-                
-            elif current_candle.timestamp < candle_timestamp:
-                # Current candle is from a previous minute, close it
-                closed_candle = self._close_candle(symbol)
-                
-                # Start a new candle
-                self._current_candles[symbol] = OHLCCandle.from_tick(tick, candle_timestamp)
-                logger.debug(f"Started new candle for {symbol} at {candle_timestamp}")
-                
-            else:
-                # Update current candle
-                current_candle.update(tick)
+            # Start a new candle
+            self._start_candle(symbol, tick, ts_minute)
             
-            return closed_candle
+        else:
+            # Update current candle (open by construction: closed
+            # candles are never left in _current_candles)
+            current_candle.add_trade(tick.price, tick.quantity)
+        
+        return closed_candle
+    
+    def _start_candle(self, symbol: str, tick: Tick, ts_minute: int) -> None:
+        """
+        Open a new candle for a symbol and schedule it for expiry.
+        
+        Must be called with the symbol's lock shard held.
+        
+        Args:
+            symbol: Normalized symbol of the tick
+            tick: The first tick of the candle
+            ts_minute: The minute (since the epoch) the candle covers
+        """
+        self._current_candles[symbol] = OHLCCandle.from_tick(tick, ts_minute)
+        with self._expiry_lock:
+            heapq.heappush(self._expiry_heap, (ts_minute, symbol))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Started new candle for %s at minute %d", symbol, ts_minute)
     
     def _close_candle(self, symbol: str) -> Optional[OHLCCandle]:
         """
-        Close the current candle for a symbol.
+        Close the current candle for a symbol and notify callbacks.
+        
+        Must be called with the symbol's lock shard held.
+        
+        Args:
+            symbol: The symbol to close the candle for
+            
+        Returns:
+            The closed candle, or None if no candle exists
+        """
+        candle = self._finalize_candle(symbol)
+        if candle:
+            self._notify_candle(candle)
+        return candle
+    
+    def _finalize_candle(self, symbol: str) -> Optional[OHLCCandle]:
+        """
+        Mark the current candle for a symbol closed and add it to history.
+        
+        Must be called with the symbol's lock shard held. Callbacks are
+        not notified; see _notify_candle().
         
         Args:
             symbol: The symbol to close the candle for
@@ -130,30 +241,36 @@ class OHLCAggregator:
         if candle:
             candle.is_closed = True
             
-            # Add to history
+            # Add to history (the deque drops the oldest candle when full)
             self._history[symbol].append(candle)
             
-            # Trim history if needed
-            if len(self._history[symbol]) > self._history_size:
-                self._history[symbol] = self._history[symbol][-self._history_size:]
-            
             logger.info(
-                f"Closed candle for {symbol}: "
-                f"O={candle.open:.2f} H={candle.high:.2f} "
-                f"L={candle.low:.2f} C={candle.close:.2f} "
-                f"V={candle.volume:.4f} Ticks={candle.tick_count}"
+                "Closed candle for %s: O=%.2f H=%.2f L=%.2f C=%.2f V=%.4f Ticks=%d",
+                symbol, candle.open, candle.high, candle.low, candle.close,
+                candle.volume, candle.tick_count
             )
             
-            # Notify callbacks
-            for callback in self._candle_callbacks:
-                try:
-                    callback(candle)
-                except Exception as e:
-                    logger.error(f"Error in candle callback: {e}")
-            
             return candle
         return None
     
+    def _notify_candle(self, candle: OHLCCandle) -> None:
+        """
+        Pass a closed candle to the candle callbacks.
+        
+        Must not be called with _expiry_lock held: a callback that starts
+        a candle takes it again.
+        
+        Args:
+            candle: The closed candle
+        """
+        # The tuple is rebuilt on add/remove, so registering a callback
+        # mid-notification cannot affect this loop
+        for callback in self._candle_callbacks:
+            try:
+                callback(candle)
+            except Exception as e:
+                logger.error(f"Error in candle callback: {e}")
+    
     def close_all_candles(self) -> List[OHLCCandle]:
         """
         Force close all current candles.
@@ -162,12 +279,14 @@ class OHLCAggregator:
             List of closed candles
         """
         closed = []
-        with self._lock:
+        with self._all_locks():
             for symbol in list(self._current_candles.keys()):
                 candle = self._close_candle(symbol)
                 if candle:
                     closed.append(candle)
             self._current_candles.clear()
+            with self._expiry_lock:
+                self._expiry_heap.clear()
         return closed
     
     async def _minute_boundary_checker(self) -> None:
@@ -178,25 +297,34 @@ class OHLCAggregator:
         """
         while self._running:
             try:
-                # Calculate time until next minute
-                now = datetime.utcnow()
-                next_minute = (now + timedelta(minutes=1)).replace(second=0, microsecond=0)
-                sleep_time = (next_minute - now).total_seconds() + 0.1  # Add small buffer
-                
-                await asyncio.sleep(sleep_time)
+                # Sleep until just past the next minute boundary
+                now = time.time()
+                next_minute = (int(now) // 60 + 1) * 60
+                await asyncio.sleep(next_minute - now + 0.05)  # Add small buffer
                 
                 if not self._running:
                     break
                 
                 # Check and close any candles from previous minutes
-                current_timestamp = self._get_candle_timestamp(datetime.utcnow())
+                current_minute = int(time.time()) // 60
                 
-                with self._lock:
-                    for symbol in list(self._current_candles.keys()):
+                # Pop only the expired heap entries instead of scanning every
+                # symbol. An entry is stale if its symbol has since rolled
+                # over to a newer candle on its own, so skip those.
+                heap = self._expiry_heap
+                closed = []
+                with self._all_locks(), self._expiry_lock:
+                    while heap and heap[0][0] < current_minute:
+                        ts_minute, symbol = heapq.heappop(heap)
                         candle = self._current_candles.get(symbol)
-                        if candle and candle.timestamp < current_timestamp:
-                            self._close_candle(symbol)
+                        if candle is not None and candle.ts_minute == ts_minute:
+                            closed.append(self._finalize_candle(symbol))
                             del self._current_candles[symbol]
+                
+                # Callbacks may start a candle, which takes _expiry_lock,
+                # so they run once the locks have been released
+                for candle in closed:
+                    self._notify_candle(candle)
                             
             except asyncio.CancelledError:
                 break
@@ -238,8 +366,9 @@ class OHLCAggregator:
         Returns:
             Current candle or None if not building
         """
-        with self._lock:
-            return self._current_candles.get(symbol.upper())
+        symbol = normalize_symbol(symbol)
+        with self._lock_for(symbol):
+            return self._current_candles.get(symbol)
     
     def get_history(self, symbol: str, limit: Optional[int] = None) -> List[OHLCCandle]:
         """
@@ -252,11 +381,58 @@ class OHLCAggregator:
         Returns:
             List of finalized candles (oldest to newest)
         """
-        with self._lock:
-            history = self._history.get(symbol.upper(), [])
-            if limit:
-                return history[-limit:]
-            return list(history)
+        symbol = normalize_symbol(symbol)
+        with self._lock_for(symbol):
+            history = self._history.get(symbol)
+            if history is None:
+                return []
+            return self._recent(history, limit)
+    
+    @staticmethod
+    def _recent(history: Deque[OHLCCandle], limit: Optional[int]) -> List[OHLCCandle]:
+        """
+        Copy the newest candles out of a history deque.
+        
+        Args:
+            history: A symbol's finalized candles
+            limit: Maximum number of candles to return (most recent)
+            
+        Returns:
+            List of finalized candles (oldest to newest)
+        """
+        if limit and limit < len(history):
+            # Walk back from the newest candle so only `limit` items are touched
+            recent = list(islice(reversed(history), limit))
+            recent.reverse()
+            return recent
+        return list(history)
+    
+    def snapshot(
+        self, limit: Optional[int] = None
+    ) -> Dict[str, Tuple[List[OHLCCandle], Optional[OHLCCandle]]]:
+        """
+        Get history and current candle for every symbol in one pass.
+        
+        Takes the lock shards once instead of once per symbol per call,
+        and gives a consistent view across symbols.
+        
+        Args:
+            limit: Maximum number of history candles per symbol (most recent)
+            
+        Returns:
+            Dict mapping symbols to (history, current candle or None)
+        """
+        with self._all_locks():
+            symbols = set(self._current_candles)
+            symbols.update(self._history)
+            return {
+                symbol: (
+                    self._recent(self._history[symbol], limit)
+                    if symbol in self._history else [],
+                    self._current_candles.get(symbol)
+                )
+                for symbol in symbols
+            }
     
     def get_all_current_candles(self) -> Dict[str, OHLCCandle]:
         """
@@ -265,8 +441,8 @@ class OHLCAggregator:
         Returns:
             Dict mapping symbols to their current candles
         """
-        with self._lock:
-            return dict(self._current_candles)
+        # Copying a dict is atomic under the GIL; no shard lock needed
+        return dict(self._current_candles)
     
     def get_symbols(self) -> List[str]:
         """
@@ -275,7 +451,6 @@ class OHLCAggregator:
         Returns:
             List of symbol names
         """
-        with self._lock:
-            symbols = set(self._current_candles.keys())
-            symbols.update(self._history.keys())
-            return list(symbols)
+        symbols = set(self._current_candles.keys())
+        symbols.update(self._history.keys())
+        return list(symbols)
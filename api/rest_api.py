@@ -5,14 +5,21 @@ This module provides FastAPI endpoints for accessing trading data,
 managing symbols, and viewing system status.
 """
 
-from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Header, HTTPException, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from starlette.datastructures import Headers
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+import asyncio
+import gzip
 import logging
 import os
+import random
+import time
+import orjson
 
 from aggregation.ohlc_aggregator import OHLCAggregator
 from strategy.strategy_manager import StrategyManager
@@ -21,61 +28,123 @@ from data_ingestion.tick_store import TickStore
 
 logger = logging.getLogger(__name__)
 
+# Seconds a /health response is reused before being rebuilt
+HEALTH_CACHE_TTL = 1.0
 
-# Request/Response models
-class SymbolRequest(BaseModel):
-    """Request model for adding a symbol."""
-    symbol: str
+# Trades encoded per chunk when /trades streams its response
+TRADES_STREAM_CHUNK = 100
 
 
-class CandleResponse(BaseModel):
-    """Response model for OHLC candle data."""
-    symbol: str
-    open: float
-    high: float
-    low: float
-    close: float
-    timestamp: str
-    volume: float
-    tick_count: int
-    is_closed: bool
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+    
+    Data endpoints return this directly, which skips FastAPI's
+    jsonable_encoder pass as well as the slower stdlib encoder.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
-class PositionResponse(BaseModel):
-    """Response model for position data."""
-    symbol: str
-    side: str
-    entry_price: float
-    entry_time: Optional[str]
-    quantity: float
-    current_price: float
-    unrealized_pnl: float
-    realized_pnl: float
-    stop_loss_price: float
+class CompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that sets Cache-Control and serves gzip-compressed text assets.
+    
+    Text assets are compressed once when the app is created, so requests
+    never compress on the event loop. A file modified later is served
+    uncompressed while a worker thread recompresses it. HEAD and Range
+    requests always get the plain file response. Asset names are not
+    content-hashed, so the max-age stays short rather than marking them
+    immutable.
+    """
+    
+    COMPRESSIBLE_SUFFIXES = (".js", ".css", ".html", ".svg", ".json")
+    
+    def __init__(self, *args, max_age: int = 60, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache_control = f"public, max-age={max_age}"
+        self._gzip_cache: Dict[str, Tuple[float, bytes]] = {}
+        # Paths being recompressed in a worker thread
+        self._gzip_pending: set = set()
+        if self.directory is not None:
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if name.endswith(self.COMPRESSIBLE_SUFFIXES):
+                        # Keyed like the resolved paths StaticFiles serves
+                        self._compress(os.path.realpath(os.path.join(root, name)))
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = self._cache_control
+        full_path = str(full_path)
+        if response.status_code != 200 or not full_path.endswith(self.COMPRESSIBLE_SUFFIXES):
+            return response
+        response.headers["Vary"] = "Accept-Encoding"
+        request_headers = Headers(scope=scope)
+        if (
+            scope["method"] != "GET"
+            or "range" in request_headers
+            or "gzip" not in request_headers.get("accept-encoding", "")
+        ):
+            return response
+        
+        body = self._gzipped(full_path, stat_result.st_mtime)
+        if body is None:
+            return response
+        
+        headers = dict(response.headers)
+        del headers["content-length"]
+        headers["content-encoding"] = "gzip"
+        # The compressed body is a different representation; a weak ETag
+        # still matches the If-None-Match check in StaticFiles
+        headers["etag"] = "W/" + headers["etag"]
+        return Response(body, headers=headers)
+    
+    def _gzipped(self, full_path: str, mtime: float) -> Optional[bytes]:
+        """
+        Get the compressed body of a file if it is current.
+        
+        Args:
+            full_path: Path of the requested file
+            mtime: Its current modification time
+            
+        Returns:
+            Compressed body, or None while a recompression is in progress
+        """
+        cached = self._gzip_cache.get(full_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        if full_path not in self._gzip_pending:
+            self._gzip_pending.add(full_path)
+            future = asyncio.get_running_loop().run_in_executor(
+                None, self._compress, full_path
+            )
+            future.add_done_callback(lambda _: self._gzip_pending.discard(full_path))
+        return None
+    
+    def _compress(self, full_path: str) -> None:
+        """
+        Compress a file into the cache, keyed by its modification time.
+        
+        Args:
+            full_path: Path of the file to compress
+        """
+        try:
+            mtime = os.stat(full_path).st_mtime
+            with open(full_path, "rb") as f:
+                body = gzip.compress(f.read(), compresslevel=9, mtime=0)
+        except OSError as e:
+            logger.warning(f"Could not compress static file {full_path}: {e}")
+            return
+        self._gzip_cache[full_path] = (mtime, body)
 
 
-class TradeResponse(BaseModel):
-    """Response model for trade data."""
-    timestamp: str
+# Request models
+class SymbolRequest(BaseModel):
+    """Request model for adding a symbol."""
     symbol: str
-    side: str
-    size: float
-    price: float
-    variant: str
-    order_id: Optional[str]
-    status: str
-    pnl: Optional[float]
-    notes: Optional[str]
-
-
-# Global references (set during app creation)
-_ohlc_aggregator: Optional[OHLCAggregator] = None
-_strategy_manager: Optional[StrategyManager] = None
-_trade_logger: Optional[TradeLogger] = None
-_tick_store: Optional[TickStore] = None
-_ws_server = None  # WebSocket server for FastAPI integration
-_add_symbol_callback = None
-_remove_symbol_callback = None
 
 
 def create_app(
@@ -101,29 +170,30 @@ def create_app(
     Returns:
         Configured FastAPI application
     """
-    global _ohlc_aggregator, _strategy_manager, _trade_logger, _tick_store
-    global _add_symbol_callback, _remove_symbol_callback, _ws_server
+    # Endpoints reach the components above through this closure rather
+    # than module globals or app.state.
+    
+    # Encoded bodies of responses that only change on symbol add/remove
+    strategy_info_cache: Optional[bytes] = None
+    debug_cache = orjson.dumps({
+        "trade_logger": trade_logger is not None,
+        "tick_store": tick_store is not None,
+        "strategy_manager": strategy_manager is not None,
+        "ohlc_aggregator": ohlc_aggregator is not None
+    })
     
-    _ohlc_aggregator = ohlc_aggregator
-    _strategy_manager = strategy_manager
-    _trade_logger = trade_logger
-    _tick_store = tick_store
-    _ws_server = ws_server
-    _add_symbol_callback = add_symbol_callback
-    _remove_symbol_callback = remove_symbol_callback
+    # /health body and the monotonic time it was built; frequent
+    # load-balancer probes reuse it for HEALTH_CACHE_TTL seconds
+    health_cache: Optional[bytes] = None
+    health_cache_time = 0.0
     
     app = FastAPI(
         title="Crypto Trading System API",
         description="API for accessing live crypto trading data and system status",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=ORJSONResponse
     )
     
-    # Store references in app.state (recommended FastAPI pattern)
-    app.state.trade_logger = trade_logger
-    app.state.tick_store = tick_store
-    app.state.strategy_manager = strategy_manager
-    app.state.ohlc_aggregator = ohlc_aggregator
-    
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -137,28 +207,28 @@ def create_app(
     @app.get("/health", tags=["System"])
     async def health_check():
         """Check if the system is healthy."""
-        return {
-            "status": "healthy",
-            "symbols": _strategy_manager.get_symbols() if _strategy_manager else [],
-            "tick_count": len(_tick_store) if _tick_store else 0
-        }
+        nonlocal health_cache, health_cache_time
+        now = time.monotonic()
+        if health_cache is None or now - health_cache_time >= HEALTH_CACHE_TTL:
+            health_cache = orjson.dumps({
+                "status": "healthy",
+                "symbols": strategy_manager.get_symbols() if strategy_manager is not None else [],
+                "tick_count": len(tick_store) if tick_store is not None else 0
+            })
+            health_cache_time = now
+        return Response(content=health_cache, media_type="application/json")
     
     # Debug endpoint
     @app.get("/debug", tags=["System"])
     async def debug_status():
         """Debug endpoint to check component availability."""
-        return {
-            "trade_logger": _trade_logger is not None,
-            "tick_store": _tick_store is not None,
-            "strategy_manager": _strategy_manager is not None,
-            "ohlc_aggregator": _ohlc_aggregator is not None
-        }
+        return Response(content=debug_cache, media_type="application/json")
     
     # Symbol management endpoints
     @app.get("/symbols", tags=["Symbols"])
     async def get_symbols() -> List[str]:
         """Get list of active symbols."""
-        return _strategy_manager.get_symbols() if _strategy_manager else []
+        return strategy_manager.get_symbols() if strategy_manager is not None else []
     
     @app.post("/symbols/{symbol}", tags=["Symbols"])
     async def add_symbol(symbol: str) -> Dict[str, str]:
@@ -168,13 +238,16 @@ def create_app(
         Args:
             symbol: Trading symbol (e.g., 'BTCUSDT')
         """
+        nonlocal strategy_info_cache
         symbol = symbol.upper()
         
-        if _add_symbol_callback:
-            await _add_symbol_callback(symbol)
+        if add_symbol_callback is not None:
+            await add_symbol_callback(symbol)
+        
+        if strategy_manager is not None:
+            strategy_manager.add_symbol(symbol)
         
-        if _strategy_manager:
-            _strategy_manager.add_symbol(symbol)
+        strategy_info_cache = None
         
         return {"message": f"Symbol {symbol} added successfully"}
     
@@ -186,44 +259,65 @@ def create_app(
         Args:
             symbol: Trading symbol to remove
         """
+        nonlocal strategy_info_cache
         symbol = symbol.upper()
         
-        if _remove_symbol_callback:
-            await _remove_symbol_callback(symbol)
+        if remove_symbol_callback is not None:
+            await remove_symbol_callback(symbol)
         
-        if _strategy_manager:
-            _strategy_manager.remove_symbol(symbol)
+        if strategy_manager is not None:
+            strategy_manager.remove_symbol(symbol)
+        
+        strategy_info_cache = None
         
         return {"message": f"Symbol {symbol} removed successfully"}
     
     # Candle data endpoints
-    @app.get("/candles/{symbol}", tags=["Candles"])
+    @app.get("/candles/{symbol}", tags=["Candles"], response_model=None)
     async def get_candles(
         symbol: str,
-        limit: int = Query(default=50, ge=1, le=500)
+        limit: int = Query(default=50, ge=1, le=500),
+        if_none_match: Optional[str] = Header(default=None)
     ) -> Dict[str, Any]:
         """
         Get OHLC candle history for a symbol.
         
+        Responses carry an ETag; a poll whose If-None-Match still matches
+        gets 304 Not Modified without the payload being rebuilt.
+        
         Args:
             symbol: Trading symbol
             limit: Number of candles to return (default: 50)
         """
-        if not _ohlc_aggregator:
+        if ohlc_aggregator is None:
             raise HTTPException(status_code=500, detail="Aggregator not available")
         
         symbol = symbol.upper()
-        history = _ohlc_aggregator.get_history(symbol, limit)
-        current = _ohlc_aggregator.get_current_candle(symbol)
+        history = ohlc_aggregator.get_history(symbol, limit)
+        current = ohlc_aggregator.get_current_candle(symbol)
+        
+        # History only grows by whole closed candles and the building candle
+        # only gains ticks, so these identify the response body
+        etag = '"{}-{}-{}-{}-{}-{}"'.format(
+            symbol,
+            history[-1].ts_minute if history else 0,
+            len(history),
+            current.ts_minute if current else 0,
+            current.tick_count if current else 0,
+            limit
+        )
+        headers = {"ETag": etag, "Cache-Control": "max-age=1"}
+        if if_none_match == etag:
+            return Response(status_code=304, headers=headers)
         
-        return {
+        return ORJSONResponse({
             "symbol": symbol,
-            "history": [c.to_dict() for c in history],
+            "history": [orjson.Fragment(c.to_json_bytes()) for c in history],
             "current": current.to_dict() if current else None,
             "count": len(history)
-        }
+        }, headers=headers)
     
-    @app.get("/candles", tags=["Candles"])
+    @app.get("/candles", tags=["Candles"], response_model=None)
     async def get_all_candles(
         limit: int = Query(default=10, ge=1, le=100)
     ) -> Dict[str, Any]:
@@ -233,30 +327,29 @@ def create_app(
         Args:
             limit: Number of candles per symbol (default: 10)
         """
-        if not _ohlc_aggregator:
+        if ohlc_aggregator is None:
             raise HTTPException(status_code=500, detail="Aggregator not available")
         
-        result = {}
-        for symbol in _ohlc_aggregator.get_symbols():
-            history = _ohlc_aggregator.get_history(symbol, limit)
-            current = _ohlc_aggregator.get_current_candle(symbol)
-            result[symbol] = {
-                "history": [c.to_dict() for c in history],
+        result = {
+            symbol: {
+                "history": [orjson.Fragment(c.to_json_bytes()) for c in history],
                 "current": current.to_dict() if current else None
             }
+            for symbol, (history, current) in ohlc_aggregator.snapshot(limit).items()
+        }
         
-        return result
+        return ORJSONResponse(result)
     
     # Position endpoints
-    @app.get("/positions", tags=["Positions"])
+    @app.get("/positions", tags=["Positions"], response_model=None)
     async def get_all_positions() -> Dict[str, Any]:
         """Get all current positions across symbols and variants."""
-        if not _strategy_manager:
+        if strategy_manager is None:
             raise HTTPException(status_code=500, detail="Strategy manager not available")
         
-        return _strategy_manager.get_status()
+        return ORJSONResponse(strategy_manager.get_status())
     
-    @app.get("/positions/{symbol}", tags=["Positions"])
+    @app.get("/positions/{symbol}", tags=["Positions"], response_model=None)
     async def get_symbol_positions(symbol: str) -> Dict[str, Any]:
         """
         Get positions for a specific symbol.
@@ -264,26 +357,26 @@ def create_app(
         Args:
             symbol: Trading symbol
         """
-        if not _strategy_manager:
+        if strategy_manager is None:
             raise HTTPException(status_code=500, detail="Strategy manager not available")
         
         symbol = symbol.upper()
         positions = {}
         
-        for variant in _strategy_manager.get_variants():
-            position = _strategy_manager.get_position(symbol, variant.name)
+        for variant in strategy_manager.get_variants():
+            position = strategy_manager.get_position(symbol, variant.name)
             if position:
-                strategy = _strategy_manager.get_strategy(symbol, variant.name)
+                strategy = strategy_manager.get_strategy(symbol, variant.name)
                 positions[variant.name] = {
                     "position": position.to_dict(),
                     "variant": variant.to_dict(),
                     "indicators": strategy.get_indicators() if strategy else None
                 }
         
-        return {"symbol": symbol, "positions": positions}
+        return ORJSONResponse({"symbol": symbol, "positions": positions})
     
     # Trade history endpoints
-    @app.get("/trades", tags=["Trades"])
+    @app.get("/trades", tags=["Trades"], response_model=None)
     async def get_trades(
         symbol: Optional[str] = None,
         variant: Optional[str] = None,
@@ -297,39 +390,55 @@ def create_app(
             variant: Filter by variant (optional)
             limit: Maximum trades to return
         """
-        if not _trade_logger:
+        if trade_logger is None:
             raise HTTPException(status_code=500, detail="Trade logger not available")
         
-        trades = _trade_logger.get_trades(
+        trades = await trade_logger.get_trades_async(
             symbol=symbol.upper() if symbol else None,
             variant=variant,
             limit=limit
         )
         
-        summary = _trade_logger.get_summary(
+        summary = trade_logger.get_summary(
             symbol=symbol.upper() if symbol else None,
             variant=variant
         )
         
-        return {
-            "trades": trades,
-            "summary": summary,
-            "count": len(trades)
-        }
+        if len(trades) <= TRADES_STREAM_CHUNK:
+            return ORJSONResponse({
+                "trades": trades,
+                "summary": summary,
+                "count": len(trades)
+            })
+        
+        async def stream():
+            # Encode the trade list a chunk at a time so large pages are
+            # written while later chunks are still being encoded
+            yield b'{"trades":['
+            for start in range(0, len(trades), TRADES_STREAM_CHUNK):
+                chunk = orjson.dumps(
+                    trades[start:start + TRADES_STREAM_CHUNK],
+                    option=orjson.OPT_NON_STR_KEYS
+                )
+                yield chunk[1:-1] if start == 0 else b"," + chunk[1:-1]
+            yield b'],"summary":' + orjson.dumps(summary, option=orjson.OPT_NON_STR_KEYS)
+            yield b',"count":%d}' % len(trades)
+        
+        return StreamingResponse(stream(), media_type="application/json")
     
     # Latest tick endpoints
-    @app.get("/ticks", tags=["Ticks"])
+    @app.get("/ticks", tags=["Ticks"], response_model=None)
     async def get_latest_ticks() -> Dict[str, Any]:
         """Get latest tick for all symbols."""
-        if not _tick_store:
+        if tick_store is None:
             raise HTTPException(status_code=500, detail="Tick store not available")
         
-        ticks = _tick_store.get_all()
-        return {
+        ticks = tick_store.get_all()
+        return ORJSONResponse({
             symbol: tick.to_dict() for symbol, tick in ticks.items()
-        }
+        })
     
-    @app.get("/ticks/{symbol}", tags=["Ticks"])
+    @app.get("/ticks/{symbol}", tags=["Ticks"], response_model=None)
     async def get_symbol_tick(symbol: str) -> Dict[str, Any]:
         """
         Get latest tick for a symbol.
@@ -337,41 +446,41 @@ def create_app(
         Args:
             symbol: Trading symbol
         """
-        if not _tick_store:
+        if tick_store is None:
             raise HTTPException(status_code=500, detail="Tick store not available")
         
-        tick = _tick_store.get(symbol.upper())
+        tick = tick_store.get(symbol.upper())
         if not tick:
             raise HTTPException(status_code=404, detail=f"No tick data for {symbol}")
         
-        return tick.to_dict()
+        return ORJSONResponse(tick.to_dict())
     
     # Strategy info endpoint
-    @app.get("/strategy", tags=["Strategy"])
+    @app.get("/strategy", tags=["Strategy"], response_model=None)
     async def get_strategy_info() -> Dict[str, Any]:
         """Get strategy configuration and variant information."""
-        if not _strategy_manager:
+        nonlocal strategy_info_cache
+        if strategy_manager is None:
             raise HTTPException(status_code=500, detail="Strategy manager not available")
         
-        return {
-            "type": "SMA/EMA Crossover",
-            "parameters": {
-                "sma_period": _strategy_manager.sma_period,
-                "ema_period": _strategy_manager.ema_period
-            },
-            "variants": [v.to_dict() for v in _strategy_manager.get_variants()],
-            "signals": {
-                "BUY": "EMA crosses above SMA (bullish crossover)",
-                "SELL": "EMA crosses below SMA (bearish crossover) OR Stop Loss triggered"
-            }
-        }
-    
-    # Manual trading endpoint - using app.state for reliable access
-    logger.info(f"Trade endpoint setup: trade_logger={app.state.trade_logger}")
+        if strategy_info_cache is None:
+            strategy_info_cache = orjson.dumps({
+                "type": "SMA/EMA Crossover",
+                "parameters": {
+                    "sma_period": strategy_manager.sma_period,
+                    "ema_period": strategy_manager.ema_period
+                },
+                "variants": [v.to_dict() for v in strategy_manager.get_variants()],
+                "signals": {
+                    "BUY": "EMA crosses above SMA (bullish crossover)",
+                    "SELL": "EMA crosses below SMA (bearish crossover) OR Stop Loss triggered"
+                }
+            })
+        return Response(content=strategy_info_cache, media_type="application/json")
     
+    # Manual trading endpoint
     @app.post("/trade", tags=["Trading"])
     async def place_manual_trade(
-        request: Request,
         symbol: str,
         side: str,
         variant: str,
@@ -386,19 +495,11 @@ def create_app(
             variant: Strategy variant (A or B)
             quantity: Trade quantity
         """
-        from datetime import datetime
-        import random
-        
-        # Get references from app.state
-        tl = request.app.state.trade_logger
-        ts = request.app.state.tick_store
-        sm = request.app.state.strategy_manager
-        
-        # Check for None explicitly (TradeLogger has __len__ which makes 'not tl' fail when empty)
-        if tl is None:
+        # Check for None explicitly (TradeLogger has __len__, so an empty logger is falsy)
+        if trade_logger is None:
             raise HTTPException(status_code=500, detail="Trade logger not available")
         
-        if ts is None:
+        if tick_store is None:
             raise HTTPException(status_code=500, detail="Tick store not available")
         
         symbol = symbol.upper()
@@ -412,7 +513,7 @@ def create_app(
             raise HTTPException(status_code=400, detail="Variant must be A or B")
         
         # Get current price from tick store
-        tick = ts.get(symbol)
+        tick = tick_store.get(symbol)
         if not tick:
             raise HTTPException(status_code=404, detail=f"No price data for {symbol}")
         
@@ -425,30 +526,31 @@ def create_app(
             pnl = random.uniform(-0.05, 0.15) * price * quantity
         
         # Log the trade
-        trade = tl.log_trade(
+        now = datetime.utcnow()
+        trade = trade_logger.log_trade(
             symbol=symbol,
             side=side,
             size=quantity,
             price=price,
             variant=variant,
-            order_id=f"MANUAL-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}",
+            order_id=f"MANUAL-{now.strftime('%Y%m%d%H%M%S')}",
             status="FILLED",
             pnl=pnl,
             notes=f"Manual {side} order via dashboard"
         )
         
         # Update position state if strategy manager available
-        if sm:
+        if strategy_manager is not None:
             if side == "BUY":
-                sm.enter_position(
+                strategy_manager.enter_position(
                     symbol=symbol,
                     variant_name=variant,
                     price=price,
                     quantity=quantity,
-                    timestamp=datetime.utcnow()
+                    timestamp=now
                 )
             else:
-                sm.exit_position(
+                strategy_manager.exit_position(
                     symbol=symbol,
                     variant_name=variant,
                     price=price
@@ -467,6 +569,13 @@ def create_app(
     # Determine frontend directory path
     frontend_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
     
+    # Resolve the page paths once; pages are checked at startup, not per request
+    index_path = os.path.join(frontend_dir, "index.html")
+    analytics_path = os.path.join(frontend_dir, "analytics.html")
+    has_index = os.path.exists(index_path)
+    has_analytics = os.path.exists(analytics_path)
+    page_headers = {"Cache-Control": "public, max-age=60"}
+    
     # =========================================================================
     # WebSocket endpoint for real-time updates (integrated with FastAPI)
     # =========================================================================
@@ -478,8 +587,8 @@ def create_app(
         
         This endpoint integrates with the WebSocketServer for broadcasting.
         """
-        if _ws_server:
-            await _ws_server.handle_fastapi_websocket(websocket)
+        if ws_server is not None:
+            await ws_server.handle_fastapi_websocket(websocket)
         else:
             # Fallback: simple echo/disconnect if no ws_server
             await websocket.accept()
@@ -496,22 +605,20 @@ def create_app(
     @app.get("/", response_class=FileResponse, include_in_schema=False)
     async def serve_index():
         """Serve the main dashboard page."""
-        index_path = os.path.join(frontend_dir, "index.html")
-        if os.path.exists(index_path):
-            return FileResponse(index_path, media_type="text/html")
+        if has_index:
+            return FileResponse(index_path, media_type="text/html", headers=page_headers)
         return {"error": "index.html not found"}
     
     @app.get("/analytics.html", response_class=FileResponse, include_in_schema=False)
     async def serve_analytics():
         """Serve the analytics page."""
-        analytics_path = os.path.join(frontend_dir, "analytics.html")
-        if os.path.exists(analytics_path):
-            return FileResponse(analytics_path, media_type="text/html")
+        if has_analytics:
+            return FileResponse(analytics_path, media_type="text/html", headers=page_headers)
         return {"error": "analytics.html not found"}
     
     # Mount static files (CSS, JS) - must be after explicit routes
     if os.path.exists(frontend_dir):
-        app.mount("/", StaticFiles(directory=frontend_dir, html=False), name="static")
+        app.mount("/", CompressedStaticFiles(directory=frontend_dir, html=False), name="static")
         logger.info(f"Frontend static files mounted from {frontend_dir}")
     
     return app
@@ -7,17 +7,58 @@ WebSocket server and FastAPI WebSocket integration.
 """
 
 import asyncio
-import json
 import logging
-from typing import Set, Optional, Callable, Union, Any
+from typing import Dict, List, Optional, Callable, Set, Union, Any
+import msgpack
+import orjson
 import websockets
-from websockets.server import WebSocketServerProtocol
+from websockets.asyncio.server import ServerConnection
 
 from aggregation.models import OHLCCandle
 from strategy.base_strategy import Signal
 
 logger = logging.getLogger(__name__)
 
+# Broadcasts are coalesced per client and flushed on this interval
+FLUSH_INTERVAL = 0.05
+
+# A client's buffer is flushed immediately once it holds this many messages
+MAX_PENDING_MESSAGES = 140
+
+# Sends issued concurrently per flush before yielding to the event loop
+SEND_CHUNK_SIZE = 50
+
+# Clients negotiating this subprotocol get broadcasts as binary MessagePack
+SUBPROTOCOL_MSGPACK = "msgpack"
+
+# {"type": "batch", "items": ...} up to the items array header
+_MSGPACK_BATCH_PREFIX = b"\x82" + msgpack.packb("type") + msgpack.packb("batch") + msgpack.packb("items")
+_msgpack_packer = msgpack.Packer()
+
+
+class _Client:
+    """
+    A connected client behind one send interface.
+    
+    Wraps both standalone (websockets library) and FastAPI connections so
+    the server keeps a single client registry and a single broadcast path.
+    
+    Attributes:
+        websocket: The underlying connection
+        send_text: Coroutine function sending a text frame
+        send_bytes: Coroutine function sending a binary frame
+        close: Coroutine function closing the connection
+        binary: Whether broadcasts go out as MessagePack
+    """
+    __slots__ = ("websocket", "send_text", "send_bytes", "close", "binary")
+    
+    def __init__(self, websocket: Any, send_text, send_bytes, binary: bool):
+        self.websocket = websocket
+        self.send_text = send_text
+        self.send_bytes = send_bytes
+        self.close = websocket.close
+        self.binary = binary
+
 
 class WebSocketServer:
     """
@@ -28,10 +69,18 @@ class WebSocketServer:
     - Strategy signals
     - Tick updates (optional)
     
+    Broadcast messages are buffered per client and flushed every
+    FLUSH_INTERVAL seconds. A flush with a single message sends it as-is;
+    several messages go out in one frame as {"type": "batch", "items": [...]}.
+    
+    Broadcasts are JSON text by default. Clients that negotiate the
+    "msgpack" subprotocol receive the same messages as binary MessagePack
+    frames; replies to their own requests (welcome, pong) stay JSON.
+    
     Attributes:
         host: Server host address
         port: Server port
-        clients: Set of connected client WebSocket connections
+        clients: Connected clients (standalone and FastAPI), keyed by connection
     """
     
     def __init__(self, host: str = "0.0.0.0", port: int = 8001):
@@ -44,78 +93,102 @@ class WebSocketServer:
         """
         self.host = host
         self.port = port
-        # Support both websockets library and FastAPI WebSocket clients
-        self.clients: Set[Any] = set()
-        self._fastapi_clients: Set[Any] = set()  # FastAPI WebSocket clients
+        # Both websockets library and FastAPI WebSocket clients
+        self.clients: Dict[Any, _Client] = {}
+        self._binary_clients = 0  # Clients on the msgpack subprotocol
         self._server = None
         self._running = False
         
+        # Serialized messages awaiting the next flush, per client
+        self._pending: Dict[_Client, List[Union[str, bytes]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Strong references to overflow sends spawned by _enqueue()
+        self._send_tasks: Set[asyncio.Task] = set()
+        
         logger.info(f"WebSocket server configured on {host}:{port}")
     
-    async def _register(self, websocket: WebSocketServerProtocol) -> None:
+    async def _register(self, client: _Client) -> None:
         """
         Register a new client connection.
         
         Args:
-            websocket: Client WebSocket connection
+            client: The connected client
         """
-        self.clients.add(websocket)
-        logger.info(f"Client connected: {websocket.remote_address}. Total clients: {len(self.clients)}")
+        self.clients[client.websocket] = client
+        if client.binary:
+            self._binary_clients += 1
+        logger.info(f"Client connected. Total clients: {len(self.clients)}")
         
         # Send welcome message
-        await websocket.send(json.dumps({
+        await client.send_text(self._encode({
             "type": "connected",
             "message": "Connected to Crypto Trading WebSocket Server",
             "total_clients": len(self.clients)
         }))
     
-    async def _unregister(self, websocket: WebSocketServerProtocol) -> None:
+    async def _unregister(self, client: _Client) -> None:
         """
         Unregister a client connection.
         
         Args:
-            websocket: Client WebSocket connection
+            client: The client to remove
         """
-        self.clients.discard(websocket)
+        if self.clients.pop(client.websocket, None) is None:
+            return
+        if client.binary:
+            self._binary_clients -= 1
         logger.info(f"Client disconnected. Remaining clients: {len(self.clients)}")
     
-    async def _handle_client(self, websocket: WebSocketServerProtocol) -> None:
+    async def _handle_message(self, client: _Client, message: Union[str, bytes]) -> None:
+        """
+        Handle a message from a client (e.g., subscribe to specific symbols).
+        
+        Args:
+            client: The client that sent the message
+            message: Raw JSON message
+        """
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            await client.send_text(self._encode({
+                "type": "error",
+                "message": "Invalid JSON"
+            }))
+            return
+        
+        if data.get("action") == "subscribe":
+            symbols = data.get("symbols", [])
+            await client.send_text(self._encode({
+                "type": "subscribed",
+                "symbols": symbols
+            }))
+        
+        elif data.get("action") == "ping":
+            await client.send_text(self._encode({
+                "type": "pong",
+                "timestamp": data.get("timestamp")
+            }))
+    
+    async def _handle_client(self, websocket: ServerConnection) -> None:
         """
         Handle a client WebSocket connection.
         
         Args:
             websocket: Client WebSocket connection
         """
-        await self._register(websocket)
+        client = _Client(
+            websocket, websocket.send, websocket.send,
+            binary=websocket.subprotocol == SUBPROTOCOL_MSGPACK
+        )
+        await self._register(client)
         
         try:
             async for message in websocket:
-                try:
-                    data = json.loads(message)
-                    
-                    # Handle client messages (e.g., subscribe to specific symbols)
-                    if data.get("action") == "subscribe":
-                        symbols = data.get("symbols", [])
-                        await websocket.send(json.dumps({
-                            "type": "subscribed",
-                            "symbols": symbols
-                        }))
-                    
-                    elif data.get("action") == "ping":
-                        await websocket.send(json.dumps({
-                            "type": "pong",
-                            "timestamp": data.get("timestamp")
-                        }))
-                        
-                except json.JSONDecodeError:
-                    await websocket.send(json.dumps({
-                        "type": "error",
-                        "message": "Invalid JSON"
-                    }))
+                await self._handle_message(client, message)
         except websockets.exceptions.ConnectionClosed:
             pass
         finally:
-            await self._unregister(websocket)
+            await self._unregister(client)
     
     async def broadcast(self, message: dict) -> None:
         """
@@ -124,25 +197,130 @@ class WebSocketServer:
         Args:
             message: Message dictionary to broadcast
         """
-        if not self.clients:
-            return
+        self._publish(message)
+    
+    @staticmethod
+    def _encode(message: dict) -> str:
+        """
+        Serialize a broadcast message once for every recipient.
         
-        message_str = json.dumps(message)
+        Args:
+            message: Message dictionary to serialize
+            
+        Returns:
+            JSON text of the message
+        """
+        return orjson.dumps(message).decode("utf-8")
+    
+    def _encode_binary(self, message: dict) -> Optional[bytes]:
+        """
+        Serialize a broadcast message for msgpack clients, if any.
         
-        # Create list to track failed clients
-        failed_clients = []
+        Args:
+            message: Message dictionary to serialize (plain data only)
+            
+        Returns:
+            MessagePack bytes, or None when no client needs them
+        """
+        if not self._binary_clients:
+            return None
+        return msgpack.packb(message)
+    
+    def _enqueue(self, message_str: str, message_bin: Optional[bytes] = None) -> None:
+        """
+        Buffer a serialized message for each client until the next flush.
         
-        for client in self.clients.copy():
-            try:
-                await client.send(message_str)
-            except websockets.exceptions.ConnectionClosed:
-                failed_clients.append(client)
-            except Exception as e:
-                logger.error(f"Failed to send to client: {e}")
-                failed_clients.append(client)
-        
-        # Remove failed clients
-        for client in failed_clients:
+        Args:
+            message_str: JSON text of the message
+            message_bin: MessagePack form of the message for msgpack clients
+        """
+        pending = self._pending
+        # No snapshot of the clients is needed: nothing here awaits, so
+        # the registry cannot change while it is being walked
+        for client in self.clients.values():
+            buffer = pending.get(client)
+            if buffer is None:
+                # setdefault() would allocate a throwaway list per call
+                buffer = pending[client] = []
+            if message_bin is not None and client.binary:
+                buffer.append(message_bin)
+            else:
+                buffer.append(message_str)
+            if len(buffer) >= MAX_PENDING_MESSAGES:
+                # Don't let a burst grow the buffer unbounded
+                del pending[client]
+                task = asyncio.create_task(
+                    self._send_frame(client, self._frame(buffer))
+                )
+                self._send_tasks.add(task)
+                task.add_done_callback(self._send_tasks.discard)
+        
+        if pending and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self._flush_loop())
+    
+    @staticmethod
+    def _frame(buffer: List[Union[str, bytes]]) -> Union[str, bytes]:
+        """
+        Build the frame for a client's buffered messages.
+        
+        Args:
+            buffer: Serialized messages, oldest first (all JSON text or
+                all MessagePack bytes)
+            
+        Returns:
+            The lone message, or a batch envelope around several
+        """
+        if len(buffer) == 1:
+            return buffer[0]
+        if isinstance(buffer[0], bytes):
+            return (
+                _MSGPACK_BATCH_PREFIX
+                + _msgpack_packer.pack_array_header(len(buffer))
+                + b"".join(buffer)
+            )
+        return '{"type":"batch","items":[' + ",".join(buffer) + "]}"
+    
+    async def _flush_loop(self) -> None:
+        """Flush buffered messages until there is nothing left to send."""
+        while self._pending:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            pending = list(self._pending.items())
+            self._pending = {}
+            # Clients that received the same broadcasts share one frame
+            frames: Dict[tuple, Union[str, bytes]] = {}
+            for i, (client, buffer) in enumerate(pending):
+                key = tuple(buffer)
+                frame = frames.get(key)
+                if frame is None:
+                    frame = frames[key] = self._frame(buffer)
+                pending[i] = (client, frame)
+            # Send concurrently so one slow client can't hold up the rest
+            for start in range(0, len(pending), SEND_CHUNK_SIZE):
+                if start:
+                    await asyncio.sleep(0)
+                await asyncio.gather(
+                    *(self._send_frame(client, frame)
+                      for client, frame in pending[start:start + SEND_CHUNK_SIZE]),
+                    return_exceptions=True
+                )
+    
+    async def _send_frame(self, client: _Client, frame: Union[str, bytes]) -> None:
+        """
+        Send a client's buffered messages as a single frame.
+        
+        Args:
+            client: The client to send to
+            frame: Frame built by _frame(); bytes go out as a binary frame
+        """
+        try:
+            if isinstance(frame, bytes):
+                await client.send_bytes(frame)
+            else:
+                await client.send_text(frame)
+        except websockets.exceptions.ConnectionClosed:
+            await self._unregister(client)
+        except Exception as e:
+            logger.error(f"Failed to send to client: {e}")
             await self._unregister(client)
     
     async def broadcast_candle(self, candle: OHLCCandle) -> None:
@@ -152,14 +330,7 @@ class WebSocketServer:
         Args:
             candle: The closed OHLC candle
         """
-        message = {
-            "type": "candle",
-            "data": candle.to_dict()
-        }
-        # Broadcast to standalone clients
-        await self.broadcast(message)
-        # Also broadcast to FastAPI clients
-        await self.broadcast_to_fastapi(message)
+        self._publish_candle(candle)
     
     async def broadcast_signal(
         self, 
@@ -177,7 +348,41 @@ class WebSocketServer:
             signal: Trading signal
             price: Current price
         """
+        self._publish_signal(symbol, variant, signal, price)
+    
+    def _publish_candle(self, candle: OHLCCandle) -> None:
+        """
+        Queue a closed candle for every client.
+        
+        Args:
+            candle: The closed OHLC candle
+        """
         message = {
+            "type": "candle",
+            "data": orjson.Fragment(candle.to_json_bytes())
+        }
+        binary_message = None
+        if self._binary_clients:
+            binary_message = {"type": "candle", "data": candle.to_dict()}
+        self._publish(message, binary_message)
+    
+    def _publish_signal(
+        self, 
+        symbol: str, 
+        variant: str, 
+        signal: Signal, 
+        price: float
+    ) -> None:
+        """
+        Queue a strategy signal for every client.
+        
+        Args:
+            symbol: Trading symbol
+            variant: Strategy variant
+            signal: Trading signal
+            price: Current price
+        """
+        self._publish({
             "type": "signal",
             "data": {
                 "symbol": symbol,
@@ -185,20 +390,19 @@ class WebSocketServer:
                 "signal": signal.value,
                 "price": price
             }
-        }
-        # Broadcast to standalone clients
-        await self.broadcast(message)
-        # Also broadcast to FastAPI clients
-        await self.broadcast_to_fastapi(message)
+        })
     
     def on_candle(self, candle: OHLCCandle) -> None:
         """
         Callback for candle close events.
         
+        Queues the candle directly; the flush task does the sending, so
+        no task is created per event.
+        
         Args:
             candle: The closed candle
         """
-        asyncio.create_task(self.broadcast_candle(candle))
+        self._publish_candle(candle)
     
     def on_signal(
         self, 
@@ -210,15 +414,35 @@ class WebSocketServer:
         """
         Callback for strategy signal events.
         
+        Queues the signal directly; the flush task does the sending, so
+        no task is created per event.
+        
         Args:
             symbol: Trading symbol
             variant: Strategy variant
             signal: Trading signal
             price: Current price
         """
-        asyncio.create_task(
-            self.broadcast_signal(symbol, variant, signal, price)
-        )
+        self._publish_signal(symbol, variant, signal, price)
+    
+    @staticmethod
+    def _select_subprotocol(connection: Any, subprotocols: List[str]) -> Optional[str]:
+        """
+        Pick the subprotocol for a standalone connection.
+        
+        Unlike a fixed subprotocols list, this still accepts clients that
+        offer none (they get JSON).
+        
+        Args:
+            connection: Connection being negotiated
+            subprotocols: Subprotocols offered by the client
+            
+        Returns:
+            "msgpack" if offered, otherwise None
+        """
+        if SUBPROTOCOL_MSGPACK in subprotocols:
+            return SUBPROTOCOL_MSGPACK
+        return None
     
     async def start(self) -> None:
         """Start the WebSocket server."""
@@ -230,7 +454,8 @@ class WebSocketServer:
         self._server = await websockets.serve(
             self._handle_client,
             self.host,
-            self.port
+            self.port,
+            select_subprotocol=self._select_subprotocol
         )
         
         logger.info(f"WebSocket server started on ws://{self.host}:{self.port}")
@@ -242,14 +467,23 @@ class WebSocketServer:
         
         self._running = False
         
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._pending.clear()
+        
         # Close all client connections
-        for client in self.clients.copy():
+        for client in tuple(self.clients.values()):
             try:
                 await client.close()
             except Exception:
                 pass
         
         self.clients.clear()
+        self._binary_clients = 0
         
         # Close server
         if self._server:
@@ -266,7 +500,7 @@ class WebSocketServer:
     @property
     def client_count(self) -> int:
         """Get number of connected clients (both standalone and FastAPI)."""
-        return len(self.clients) + len(self._fastapi_clients)
+        return len(self.clients)
     
     # =========================================================================
     # FastAPI WebSocket Integration
@@ -281,76 +515,44 @@ class WebSocketServer:
         Args:
             websocket: FastAPI WebSocket connection
         """
-        # Accept the connection
-        await websocket.accept()
-        
-        # Register client
-        self._fastapi_clients.add(websocket)
-        logger.info(f"FastAPI WebSocket client connected. Total clients: {self.client_count}")
-        
-        # Send welcome message
-        await websocket.send_json({
-            "type": "connected",
-            "message": "Connected to Crypto Trading WebSocket Server",
-            "total_clients": self.client_count
-        })
+        # Accept the connection, agreeing to msgpack if the client offers it
+        subprotocol = None
+        if SUBPROTOCOL_MSGPACK in websocket.scope.get("subprotocols", ()):
+            subprotocol = SUBPROTOCOL_MSGPACK
+        await websocket.accept(subprotocol=subprotocol)
+        
+        client = _Client(
+            websocket, websocket.send_text, websocket.send_bytes,
+            binary=subprotocol is not None
+        )
+        await self._register(client)
         
         try:
             while True:
                 try:
-                    # Receive and handle messages
-                    data = await websocket.receive_json()
-                    
-                    if data.get("action") == "subscribe":
-                        symbols = data.get("symbols", [])
-                        await websocket.send_json({
-                            "type": "subscribed",
-                            "symbols": symbols
-                        })
-                    elif data.get("action") == "ping":
-                        await websocket.send_json({
-                            "type": "pong",
-                            "timestamp": data.get("timestamp")
-                        })
+                    message = await websocket.receive_text()
+                    await self._handle_message(client, message)
                 except Exception:
                     # Client likely disconnected
                     break
         finally:
-            # Unregister client
-            self._fastapi_clients.discard(websocket)
-            logger.info(f"FastAPI WebSocket client disconnected. Remaining: {self.client_count}")
+            await self._unregister(client)
     
-    async def broadcast_to_fastapi(self, message: dict) -> None:
+    def _publish(self, message: dict, binary_message: Optional[dict] = None) -> None:
         """
-        Broadcast a message to all FastAPI WebSocket clients.
+        Queue a message for every client.
+        
+        The message is serialized once per wire format and the same
+        encoding is sent to every client using that format.
         
         Args:
             message: Message dictionary to broadcast
+            binary_message: Plain-data equivalent of message for MessagePack,
+                if message embeds pre-encoded JSON (defaults to message)
         """
-        if not self._fastapi_clients:
+        if not self.clients:
             return
         
-        failed_clients = []
-        
-        for client in self._fastapi_clients.copy():
-            try:
-                await client.send_json(message)
-            except Exception:
-                failed_clients.append(client)
-        
-        # Remove failed clients
-        for client in failed_clients:
-            self._fastapi_clients.discard(client)
-    
-    async def broadcast_all(self, message: dict) -> None:
-        """
-        Broadcast to both standalone and FastAPI clients.
-        
-        Args:
-            message: Message dictionary to broadcast
-        """
-        # Broadcast to standalone clients
-        await self.broadcast(message)
-        # Broadcast to FastAPI clients
-        await self.broadcast_to_fastapi(message)
-
+        self._enqueue(
+            self._encode(message), self._encode_binary(binary_message or message)
+        )
@@ -8,6 +8,7 @@ loading values from environment variables and .env files.
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import List
+from functools import lru_cache
 import os
 
 
@@ -24,6 +25,8 @@ class Settings(BaseSettings):
         variant_a_sl: Stop Loss percentage for Variant A (tighter)
         variant_b_sl: Stop Loss percentage for Variant B (looser)
         candle_history_size: Number of historical candles to retain per symbol
+        max_concurrent_orders: Maximum number of concurrently executing orders
+        cpu_affinity: CPUs to pin the process to, e.g. "0" or "0,1"
         api_host: Host for REST API server
         api_port: Port for REST API server
     """
@@ -59,6 +62,10 @@ class Settings(BaseSettings):
     # Order Configuration
     order_size_btc: float = Field(default=0.001, description="Order size for BTC pairs")
     order_size_eth: float = Field(default=0.01, description="Order size for ETH pairs")
+    max_concurrent_orders: int = Field(
+        default=8,
+        description="Maximum number of signals executing orders at once"
+    )
     
     # Candle Configuration
     candle_history_size: int = Field(
@@ -74,13 +81,30 @@ class Settings(BaseSettings):
         description="REST API port"
     )
     
+    # Process Configuration
+    cpu_affinity: str = Field(
+        default="",
+        description="Comma-separated CPU ids to pin the process to (Linux only, empty = no pinning)"
+    )
+    
     # Trade Log Configuration
     trade_log_file: str = Field(default="trades.json", description="Trade log file path")
+    trade_log_hot_window: int = Field(
+        default=10_000,
+        description="Most recent trades kept in memory; older ones are read from the log"
+    )
+    trade_log_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Trade log size that triggers rotation (0 disables rotation)"
+    )
+    trade_log_backups: int = Field(default=10, description="Rotated trade logs to keep")
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
+        # Build the validation schema on first use rather than at import
+        defer_build = True
         
         @classmethod
         def parse_env_var(cls, field_name: str, raw_val: str):
@@ -90,10 +114,12 @@ class Settings(BaseSettings):
             return raw_val
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    return settings
+    """
+    Get the global settings instance.
+    
+    Settings are read from the environment and .env on the first call,
+    not when this module is imported, and reused afterwards.
+    """
+    return Settings()
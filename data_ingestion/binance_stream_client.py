@@ -6,21 +6,29 @@ and streaming live trade data for specified symbols.
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
-from typing import List, Set, Optional, Callable
+from typing import Dict, List, Set, Optional, Union
+import orjson
 import websockets
-from websockets.exceptions import ConnectionClosed
+from websockets.asyncio.client import ClientConnection
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
+from websockets.protocol import State
 
 from config import get_settings
-from aggregation.models import Tick
+from aggregation.models import Tick, normalize_symbol
 from data_ingestion.tick_store import TickStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Messages handled back-to-back before the receive loop yields to the event loop
+MESSAGES_PER_YIELD = 32
+
+# Frame decoder, bound once so the per-message path skips the attribute lookup
+_decode = orjson.loads
+
 
 class BinanceStreamClient:
     """
@@ -37,6 +45,11 @@ class BinanceStreamClient:
         _running: Flag indicating if the client is running
     """
     
+    __slots__ = (
+        "settings", "tick_store", "symbols", "_ws", "_running",
+        "_reconnect_delay", "_stream_url", "_stream_symbols"
+    )
+    
     def __init__(self, tick_store: TickStore, symbols: Optional[List[str]] = None):
         """
         Initialize the Binance stream client.
@@ -48,40 +61,32 @@ class BinanceStreamClient:
         self.settings = get_settings()
         self.tick_store = tick_store
         self.symbols: Set[str] = set(s.lower() for s in (symbols or self.settings.symbols))
-        self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._ws: Optional[ClientConnection] = None
         self._running = False
         self._reconnect_delay = 5  # seconds
-        self._tick_callbacks: List[Callable[[Tick], None]] = []
-    
-    def add_tick_callback(self, callback: Callable[[Tick], None]) -> None:
-        """
-        Add a callback function to be called on each new tick.
+        self._stream_url = self._build_stream_url()
+        # Stream name -> canonical symbol (e.g., "btcusdt@trade" -> "BTCUSDT")
+        self._stream_symbols: Dict[str, str] = {}
         
-        Args:
-            callback: Function to call with each new Tick
-        """
-        self._tick_callbacks.append(callback)
-    
-    def remove_tick_callback(self, callback: Callable[[Tick], None]) -> None:
-        """
-        Remove a tick callback function.
-        
-        Args:
-            callback: Function to remove from callbacks
-        """
-        if callback in self._tick_callbacks:
-            self._tick_callbacks.remove(callback)
+        # Warm the tick pool and symbol cache before the first message
+        Tick.preallocate(256)
+        for symbol in self.symbols:
+            self._stream_symbols[f"{symbol}@trade"] = normalize_symbol(symbol.upper())
     
     def _build_stream_url(self) -> str:
         """
         Build the WebSocket stream URL for combined streams.
         
+        Called when the subscription list changes; reconnects reuse the
+        result stored in _stream_url.
+        
         Returns:
             Complete WebSocket URL with all symbol streams
         """
         # Build combined stream URL for trade streams
         # Format: wss://stream.testnet.binance.vision/stream?streams=btcusdt@trade/ethusdt@trade
-        streams = "/".join(f"{symbol}@trade" for symbol in self.symbols)
+        # Sorted so the URL does not depend on set iteration order
+        streams = "/".join(f"{symbol}@trade" for symbol in sorted(self.symbols))
         return f"{self.settings.binance_ws_url.replace('/ws', '/stream')}?streams={streams}"
     
     async def subscribe(self, symbol: str) -> None:
@@ -94,6 +99,11 @@ class BinanceStreamClient:
         symbol = symbol.lower()
         if symbol not in self.symbols:
             self.symbols.add(symbol)
+            self._stream_url = self._build_stream_url()
+            self._stream_symbols = {
+                **self._stream_symbols,
+                f"{symbol}@trade": normalize_symbol(symbol.upper())
+            }
             logger.info(f"Added symbol {symbol.upper()} to subscription list")
             
             # If connected, need to reconnect to update streams
@@ -111,6 +121,11 @@ class BinanceStreamClient:
         symbol = symbol.lower()
         if symbol in self.symbols:
             self.symbols.discard(symbol)
+            self._stream_url = self._build_stream_url()
+            self._stream_symbols = {
+                stream: sym for stream, sym in self._stream_symbols.items()
+                if stream != f"{symbol}@trade"
+            }
             logger.info(f"Removed symbol {symbol.upper()} from subscription list")
             
             # If connected, need to reconnect to update streams
@@ -127,39 +142,41 @@ class BinanceStreamClient:
         """
         return [s.upper() for s in self.symbols]
     
-    async def _handle_message(self, message: str) -> None:
+    async def _handle_message(self, message: Union[str, bytes]) -> None:
         """
         Handle an incoming WebSocket message.
         
         Args:
-            message: Raw JSON message from WebSocket
+            message: Raw JSON message from WebSocket, as text or undecoded bytes
         """
         try:
-            data = json.loads(message)
+            data = _decode(message)
             
             # Combined stream format: {"stream": "btcusdt@trade", "data": {...}}
-            if "stream" in data and "data" in data:
-                stream_name = data["stream"]
-                trade_data = data["data"]
-                
-                # Extract symbol from stream name (e.g., "btcusdt@trade" -> "BTCUSDT")
-                symbol = stream_name.split("@")[0].upper()
+            trade_data = data.get("data")
+            stream = data.get("stream")
+            if trade_data is not None and stream is not None:
+                # Subscribed streams map straight to their canonical symbol;
+                # otherwise use the payload's "s" field or, failing that,
+                # the stream name prefix
+                symbol = self._stream_symbols.get(stream)
+                if symbol is None:
+                    symbol = trade_data.get("s") or stream.split("@", 1)[0]
                 
                 # Parse tick from trade data
                 tick = Tick.from_binance_message(symbol, trade_data)
                 
-                # Store tick
-                self.tick_store.update(tick)
-                
-                # Notify callbacks
-                for callback in self._tick_callbacks:
-                    try:
-                        callback(tick)
-                    except Exception as e:
-                        logger.error(f"Error in tick callback: {e}")
+                try:
+                    # Store tick; the store notifies tick subscribers
+                    self.tick_store.update(tick)
+                finally:
+                    # Consumers copy what they need, so the tick can be recycled
+                    tick.release()
                         
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse message: {e}")
+        except (KeyError, ValueError) as e:
+            logger.error(f"Malformed trade message ({e!r}): {message}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
     
@@ -171,7 +188,7 @@ class BinanceStreamClient:
         """
         while self._running:
             try:
-                url = self._build_stream_url()
+                url = self._stream_url
                 logger.info(f"Connecting to Binance Testnet WebSocket...")
                 logger.info(f"Subscribing to symbols: {', '.join(s.upper() for s in self.symbols)}")
                 
@@ -179,10 +196,23 @@ class BinanceStreamClient:
                     self._ws = ws
                     logger.info("Connected to Binance Testnet WebSocket")
                     
-                    async for message in ws:
-                        if not self._running:
-                            break
-                        await self._handle_message(message)
+                    # Receive frames as bytes: orjson parses them directly,
+                    # so the UTF-8 decode to str is wasted work
+                    # recv() returns buffered frames without suspending, and one
+                    # socket read can buffer hundreds of them on a busy combined
+                    # stream; yield periodically so the API, broadcasts and
+                    # keepalive pings are not starved during a burst
+                    handled = 0
+                    try:
+                        while self._running:
+                            await self._handle_message(await ws.recv(decode=False))
+                            handled += 1
+                            if handled == MESSAGES_PER_YIELD:
+                                handled = 0
+                                await asyncio.sleep(0)
+                    except ConnectionClosedOK:
+                        # Closed on purpose (e.g. to resubscribe); reconnect now
+                        pass
                         
             except ConnectionClosed as e:
                 logger.warning(f"WebSocket connection closed: {e}")
@@ -232,4 +262,4 @@ class BinanceStreamClient:
     @property
     def is_connected(self) -> bool:
         """Check if the client is currently connected."""
-        return self._ws is not None and self._ws.open
+        return self._ws is not None and self._ws.state is State.OPEN
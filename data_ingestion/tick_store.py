@@ -5,10 +5,16 @@ This module provides thread-safe storage for the latest ticks per symbol,
 with UTC timestamp normalization.
 """
 
-import threading
+import asyncio
+import logging
 from datetime import datetime
-from typing import Dict, Optional, List
-from aggregation.models import Tick
+from typing import Dict, Optional, List, Tuple
+from aggregation.models import Tick, normalize_symbol
+
+logger = logging.getLogger(__name__)
+
+# Default capacity of a tick subscriber queue (see subscribe_queue)
+TICK_QUEUE_SIZE = 1024
 
 
 class TickStore:
@@ -16,18 +22,30 @@ class TickStore:
     Thread-safe in-memory store for the latest tick per symbol.
     
     Maintains the most recent tick for each tracked symbol with
-    proper timestamp normalization to UTC.
+    proper timestamp normalization to UTC. The store keeps its own
+    Tick per symbol and copies incoming ticks into it, so callers may
+    recycle the ticks they pass to update().
+    
+    The store is also the tick dispatcher: every tick passed to update()
+    is forwarded to subscribers and subscriber queues. Subscribers run
+    inline; subscriber queues receive a copy of the tick.
+    
+    The store has a single writer (the stream client) and many readers.
+    Every access is a single dict operation, which is atomic under the
+    GIL, so no lock is taken on the per-tick path.
     
     Attributes:
         _ticks: Dictionary mapping symbols to their latest tick
-        _lock: Threading lock for thread-safe access
     """
     
+    __slots__ = ("_ticks", "_subscribers", "_queues")
+    
     def __init__(self):
         """Initialize an empty tick store."""
         self._ticks: Dict[str, Tick] = {}
-        self._lock = threading.RLock()
-        self._subscribers: List[callable] = []
+        # Rebuilt on subscribe/unsubscribe so update() iterates a snapshot
+        self._subscribers: Tuple[callable, ...] = ()
+        self._queues: Tuple[asyncio.Queue, ...] = ()
     
     def update(self, tick: Tick) -> None:
         """
@@ -36,15 +54,49 @@ class TickStore:
         Args:
             tick: The new tick to store
         """
-        with self._lock:
-            self._ticks[tick.symbol.upper()] = tick
+        symbol = normalize_symbol(tick.symbol)
+        stored = self._ticks.get(symbol)
+        if stored is None:
+            self._ticks[symbol] = Tick(
+                symbol=symbol,
+                price=tick.price,
+                quantity=tick.quantity,
+                timestamp_ms=tick.timestamp_ms,
+                trade_id=tick.trade_id
+            )
+        else:
+            stored.price = tick.price
+            stored.quantity = tick.quantity
+            stored.timestamp_ms = tick.timestamp_ms
+            stored.trade_id = tick.trade_id
         
         # Notify subscribers
         for callback in self._subscribers:
             try:
                 callback(tick)
             except Exception as e:
-                print(f"Error in tick subscriber: {e}")
+                logger.error(f"Error in tick subscriber: {e}")
+        
+        if self._queues:
+            self._enqueue(tick)
+    
+    def _enqueue(self, tick: Tick) -> None:
+        """
+        Hand a copy of a tick to the subscriber queues.
+        
+        Full queues drop their oldest entry.
+        
+        Args:
+            tick: Incoming tick (copied, not retained)
+        """
+        # Incoming ticks may be pooled and recycled after update(), so
+        # queues get one unpooled copy shared between them
+        copy = Tick(tick.symbol, tick.price, tick.quantity, tick.timestamp_ms, tick.trade_id)
+        
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(copy)
     
     def get(self, symbol: str) -> Optional[Tick]:
         """
@@ -56,8 +108,7 @@ class TickStore:
         Returns:
             The latest Tick for the symbol, or None if not found
         """
-        with self._lock:
-            return self._ticks.get(symbol.upper())
+        return self._ticks.get(normalize_symbol(symbol))
     
     def get_all(self) -> Dict[str, Tick]:
         """
@@ -66,8 +117,7 @@ class TickStore:
         Returns:
             Dictionary of all symbols to their latest ticks
         """
-        with self._lock:
-            return dict(self._ticks)
+        return self._ticks.copy()
     
     def get_symbols(self) -> List[str]:
         """
@@ -76,17 +126,20 @@ class TickStore:
         Returns:
             List of symbol names
         """
-        with self._lock:
-            return list(self._ticks.keys())
+        return list(self._ticks)
     
     def subscribe(self, callback: callable) -> None:
         """
         Subscribe to tick updates.
         
+        Subscribers run inline inside update(), on the stream receive path,
+        so they must be cheap and must not retain the tick. Slower
+        consumers should use subscribe_queue() instead.
+        
         Args:
             callback: Function to call with each new tick
         """
-        self._subscribers.append(callback)
+        self._subscribers += (callback,)
     
     def unsubscribe(self, callback: callable) -> None:
         """
@@ -95,8 +148,37 @@ class TickStore:
         Args:
             callback: Function to remove from subscribers
         """
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        self._subscribers = tuple(
+            cb for cb in self._subscribers if cb != callback
+        )
+    
+    def subscribe_queue(self, maxsize: int = TICK_QUEUE_SIZE) -> asyncio.Queue:
+        """
+        Get a bounded queue that receives a copy of each new tick.
+        
+        Subscriber callbacks run inline in the stream receive loop, so they
+        must be cheap. Slower consumers should read from a queue in their
+        own task instead. If a consumer falls behind, its oldest queued
+        tick is dropped; update() never waits on it.
+        
+        Args:
+            maxsize: Maximum number of ticks held for this subscriber
+            
+        Returns:
+            Queue of Tick instances owned by the subscriber
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._queues += (queue,)
+        return queue
+    
+    def unsubscribe_queue(self, queue: asyncio.Queue) -> None:
+        """
+        Stop delivering ticks to a queue from subscribe_queue().
+        
+        Args:
+            queue: Queue to remove from subscribers
+        """
+        self._queues = tuple(q for q in self._queues if q is not queue)
     
     def clear(self, symbol: Optional[str] = None) -> None:
         """
@@ -105,18 +187,15 @@ class TickStore:
         Args:
             symbol: If provided, only clear this symbol. Otherwise clear all.
         """
-        with self._lock:
-            if symbol:
-                self._ticks.pop(symbol.upper(), None)
-            else:
-                self._ticks.clear()
+        if symbol:
+            self._ticks.pop(symbol.upper(), None)
+        else:
+            self._ticks.clear()
     
     def __len__(self) -> int:
         """Return the number of symbols with stored ticks."""
-        with self._lock:
-            return len(self._ticks)
+        return len(self._ticks)
     
     def __contains__(self, symbol: str) -> bool:
         """Check if a symbol has a stored tick."""
-        with self._lock:
-            return symbol.upper() in self._ticks
+        return symbol.upper() in self._ticks
@@ -5,18 +5,27 @@ This module provides a client for interacting with the Binance Testnet REST API
 to place and manage orders.
 """
 
+import binascii
 import hashlib
 import hmac
-import time
 import logging
+from time import time_ns
 from typing import Optional, Dict, Any
 from urllib.parse import urlencode
 import aiohttp
+import orjson
+from yarl import URL
 
 from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# REST endpoints used by the client; full URLs are built once per client
+ENDPOINTS = ("/v3/account", "/v3/exchangeInfo", "/v3/order", "/v3/openOrders", "/v3/ping")
+
+# Order requests should fail fast rather than hang on aiohttp's 5-minute default
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=2)
+
 
 class BinanceOrderClient:
     """
@@ -31,6 +40,11 @@ class BinanceOrderClient:
         base_url: Binance REST API base URL
     """
     
+    __slots__ = (
+        "settings", "api_key", "api_secret", "base_url", "_urls",
+        "_api_secret_bytes", "_hmac_proto", "_headers", "_session"
+    )
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -48,6 +62,17 @@ class BinanceOrderClient:
         self.api_key = api_key or self.settings.binance_api_key
         self.api_secret = api_secret or self.settings.binance_api_secret
         self.base_url = self.settings.binance_rest_url
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in ENDPOINTS}
+        
+        # Credentials are fixed for the client's lifetime, so the signing key
+        # bytes and request headers are built once rather than per request
+        self._api_secret_bytes = self.api_secret.encode("utf-8")
+        # Keyed HMAC prototype; copying it skips the per-request key setup
+        self._hmac_proto = hmac.new(self._api_secret_bytes, digestmod=hashlib.sha256)
+        self._headers = {
+            "X-MBX-APIKEY": self.api_key,
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
         
         self._session: Optional[aiohttp.ClientSession] = None
         
@@ -60,7 +85,18 @@ class BinanceOrderClient:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            # Keep warm connections and DNS results for the single Binance
+            # host so bursts of orders skip the TCP/TLS handshake
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=REQUEST_TIMEOUT
+            )
         return self._session
     
     async def close(self) -> None:
@@ -68,36 +104,30 @@ class BinanceOrderClient:
         if self._session and not self._session.closed:
             await self._session.close()
     
-    def _sign_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _sign_request(self, params: Dict[str, Any]) -> bytes:
         """
         Sign a request with HMAC-SHA256.
         
         Args:
-            params: Request parameters
+            params: Request parameters (a timestamp is added in place)
             
         Returns:
-            Parameters with signature added
+            Encoded query string with the signature appended, as ASCII bytes
         """
         # Add timestamp
-        params["timestamp"] = int(time.time() * 1000)
+        params["timestamp"] = time_ns() // 1_000_000
         
-        # Create query string and sign it
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
+        # Create query string and sign it; urlencode output is pure ASCII,
+        # and the same bytes are hashed and then sent as a POST body
+        query = urlencode(params).encode("ascii")
+        signer = self._hmac_proto.copy()
+        signer.update(query)
         
-        params["signature"] = signature
-        return params
+        return query + b"&signature=" + binascii.hexlify(signer.digest())
     
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with API key."""
-        return {
-            "X-MBX-APIKEY": self.api_key,
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        """Get request headers with API key (shared; callers must not mutate)."""
+        return self._headers
     
     async def _request(
         self,
@@ -119,45 +149,36 @@ class BinanceOrderClient:
             Response JSON data
         """
         session = await self._get_session()
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or self.base_url + endpoint
         params = params or {}
+        body: Any = None
         
         if signed:
-            params = self._sign_request(params)
+            # Send the exact bytes that were signed rather than letting
+            # aiohttp urlencode the parameters a second time
+            query = self._sign_request(params)
+            params = None
+            if method == "POST":
+                body = query
+            else:
+                url = URL(f"{url}?{query.decode('ascii')}", encoded=True)
+        elif method == "POST":
+            # POST parameters go in the form body, not the query string
+            params, body = None, params
         
         try:
-            if method == "GET":
-                async with session.get(
-                    url, 
-                    params=params, 
-                    headers=self._get_headers()
-                ) as response:
-                    data = await response.json()
-                    if response.status != 200:
-                        logger.error(f"API error: {data}")
-                    return data
-            
-            elif method == "POST":
-                async with session.post(
-                    url,
-                    data=params,
-                    headers=self._get_headers()
-                ) as response:
-                    data = await response.json()
-                    if response.status != 200:
-                        logger.error(f"API error: {data}")
-                    return data
-            
-            elif method == "DELETE":
-                async with session.delete(
-                    url,
-                    params=params,
-                    headers=self._get_headers()
-                ) as response:
-                    data = await response.json()
-                    if response.status != 200:
-                        logger.error(f"API error: {data}")
-                    return data
+            async with session.request(
+                method,
+                url,
+                params=params,
+                data=body,
+                headers=self._headers
+            ) as response:
+                raw = await response.read()
+                data = orjson.loads(raw) if raw else {}
+                if response.status != 200:
+                    logger.error(f"API error: {data}")
+                return data
                     
         except Exception as e:
             logger.error(f"Request failed: {e}")
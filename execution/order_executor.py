@@ -6,9 +6,10 @@ managing position entry/exit and trade logging.
 """
 
 import asyncio
+import hashlib
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 
 from strategy.base_strategy import Signal
 from strategy.strategy_manager import StrategyManager
@@ -18,6 +19,45 @@ from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Seconds a completed signal stays in the ledger to absorb late duplicates
+LEDGER_TTL = 60.0
+
+# Orders executing at once for a single symbol, so one busy symbol
+# cannot take every slot of the global limit
+PER_SYMBOL_ORDER_LIMIT = 2
+
+# Trade log notes
+ENTRY_NOTE = "SMA/EMA crossover entry"
+EXIT_NOTE = "SMA/EMA crossover exit"
+STOP_LOSS_NOTE = "Stop Loss triggered"
+
+
+def _fill_price(response: Dict[str, Any], fallback: float) -> float:
+    """
+    Get the average fill price of an order response.
+    
+    Args:
+        response: Order response from Binance
+        fallback: Price to use when the response has no fills
+        
+    Returns:
+        Price of the single fill, or the quantity-weighted average
+        price when the order was filled in several parts
+    """
+    fills = response.get("fills")
+    if not fills:
+        return fallback
+    if len(fills) == 1:
+        return float(fills[0].get("price", fallback))
+    
+    notional = 0.0
+    filled = 0.0
+    for fill in fills:
+        qty = float(fill["qty"])
+        notional += float(fill["price"]) * qty
+        filled += qty
+    return notional / filled if filled else fallback
+
 
 class OrderExecutor:
     """
@@ -49,7 +89,8 @@ class OrderExecutor:
         self.settings = get_settings()
         self.strategy_manager = strategy_manager
         self.order_client = order_client or BinanceOrderClient()
-        self.trade_logger = trade_logger or TradeLogger()
+        # An empty TradeLogger is falsy (it defines __len__)
+        self.trade_logger = trade_logger if trade_logger is not None else TradeLogger()
         
         # Order sizes for different base currencies
         self._order_sizes: Dict[str, float] = {
@@ -57,8 +98,24 @@ class OrderExecutor:
             "ETH": self.settings.order_size_eth
         }
         
+        # Resolved order size per configured symbol
+        self._size_by_symbol: Dict[str, float] = {
+            symbol.upper(): self._resolve_order_size(symbol.upper())
+            for symbol in self.settings.symbols
+        }
+        
         # Track pending orders to avoid duplicate execution
-        self._pending_orders: Dict[str, bool] = {}
+        self._pending_orders: Dict[Tuple[str, str], bool] = {}
+        
+        # Signal ledger: hash of the signal -> future of its order response
+        self._ledger: Dict[str, asyncio.Future] = {}
+        
+        # Bound concurrent executions, globally and per symbol
+        self._sem = asyncio.Semaphore(self.settings.max_concurrent_orders or 8)
+        self._per_symbol_sem: Dict[str, asyncio.Semaphore] = {}
+        
+        # Strong references to tasks spawned by on_signal
+        self._inflight: Set[asyncio.Task] = set()
         
         logger.info("Order executor initialized")
     
@@ -67,13 +124,26 @@ class OrderExecutor:
         Get the order size for a symbol.
         
         Args:
-            symbol: Trading symbol
+            symbol: Trading symbol (upper case)
             
         Returns:
             Order size based on base currency
         """
-        symbol = symbol.upper()
+        size = self._size_by_symbol.get(symbol)
+        if size is None:
+            size = self._size_by_symbol[symbol] = self._resolve_order_size(symbol)
+        return size
+    
+    def _resolve_order_size(self, symbol: str) -> float:
+        """
+        Determine the order size for a symbol from its base currency.
         
+        Args:
+            symbol: Trading symbol (upper case)
+            
+        Returns:
+            Order size based on base currency
+        """
         # Determine base currency from symbol
         if symbol.startswith("BTC"):
             return self._order_sizes.get("BTC", 0.001)
@@ -83,6 +153,24 @@ class OrderExecutor:
             # Default to small quantity for unknown pairs
             return 0.001
     
+    @staticmethod
+    def _signal_key(symbol: str, variant: str, signal: Signal, price: float) -> str:
+        """
+        Build the ledger key identifying a signal.
+        
+        Args:
+            symbol: Trading symbol (upper case)
+            variant: Strategy variant name
+            signal: Trading signal
+            price: Signal price
+            
+        Returns:
+            Hex digest of the canonical signal description
+        """
+        # Exact price: rounding would merge distinct signals on sub-dollar symbols
+        canonical = f"{symbol}|{variant}|{signal.value}|{price!r}"
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    
     async def execute_signal(
         self,
         symbol: str,
@@ -93,6 +181,12 @@ class OrderExecutor:
         """
         Execute a trading signal.
         
+        Identical signals (same symbol, variant, side and price) are
+        executed once: duplicates arriving while the first is in flight,
+        or within LEDGER_TTL seconds after it was filled, await and return
+        the same response instead of placing another order. A signal that
+        placed no order (rejected, failed or skipped) can be retried.
+        
         Args:
             symbol: Trading symbol
             variant: Strategy variant name
@@ -103,35 +197,74 @@ class OrderExecutor:
             Order response if order was placed, None otherwise
         """
         symbol = symbol.upper()
-        key = f"{symbol}_{variant}"
+        key = (symbol, variant)
         
-        # Prevent duplicate execution
+        # Check-and-set on the ledger; no await in between, so this is
+        # atomic on the event loop
+        signal_key = self._signal_key(symbol, variant, signal, price)
+        entry = self._ledger.get(signal_key)
+        if entry is not None:
+            logger.debug(
+                "Duplicate %s signal for %s variant %s collapsed", signal.value, symbol, variant
+            )
+            return await asyncio.shield(entry)
+        
+        # Prevent a different signal racing an in-flight order
         if self._pending_orders.get(key):
-            logger.warning(f"Order already pending for {key}")
+            logger.warning("Order already pending for %s variant %s", symbol, variant)
+            if signal == Signal.SELL:
+                self.strategy_manager.rearm_stop_loss(symbol, variant)
             return None
         
+        loop = asyncio.get_running_loop()
+        entry = loop.create_future()
+        self._ledger[signal_key] = entry
+        
+        symbol_sem = self._per_symbol_sem.get(symbol)
+        if symbol_sem is None:
+            symbol_sem = self._per_symbol_sem[symbol] = asyncio.Semaphore(PER_SYMBOL_ORDER_LIMIT)
+        
+        response = None
         try:
             self._pending_orders[key] = True
             
-            position = self.strategy_manager.get_position(symbol, variant)
+            # Take the symbol slot first so a backlogged symbol does not
+            # hold global slots while it waits
+            async with symbol_sem, self._sem:
+                position = self.strategy_manager.get_position(symbol, variant)
+                
+                if signal == Signal.BUY:
+                    response = await self._execute_buy(symbol, variant, price, position, entry)
+                
+                elif signal == Signal.SELL:
+                    response = await self._execute_sell(symbol, variant, price, position, entry)
             
-            if signal == Signal.BUY:
-                return await self._execute_buy(symbol, variant, price, position)
-            
-            elif signal == Signal.SELL:
-                return await self._execute_sell(symbol, variant, price, position)
-            
-            return None
+            return response
             
         finally:
             self._pending_orders[key] = False
+            if entry.done():
+                # An order went out: absorb late duplicates for a while,
+                # even if recording the fill failed afterwards
+                loop.call_later(LEDGER_TTL, self._ledger.pop, signal_key, None)
+            else:
+                # Nothing was placed (rejected, skipped, failed or cancelled;
+                # the client reports failures as error dicts rather than
+                # raising), so forget the signal to let it be retried
+                self._ledger.pop(signal_key, None)
+                entry.set_result(response)
+                if signal == Signal.SELL:
+                    # A stop loss is signalled once per position; let the
+                    # next price below it retry the exit
+                    self.strategy_manager.rearm_stop_loss(symbol, variant)
     
     async def _execute_buy(
         self,
         symbol: str,
         variant: str,
         price: float,
-        position
+        position,
+        placed: asyncio.Future
     ) -> Optional[Dict[str, Any]]:
         """
         Execute a BUY signal.
@@ -141,20 +274,22 @@ class OrderExecutor:
             variant: Strategy variant
             price: Current price
             position: Current position state
+            placed: Ledger future, resolved with the response once the
+                order has been placed
             
         Returns:
             Order response if successful
         """
         # Don't buy if already in position
         if position and position.side == "LONG":
-            logger.info(f"Already in LONG position for {symbol} variant {variant}")
+            logger.info("Already in LONG position for %s variant %s", symbol, variant)
             return None
         
         quantity = self._get_order_size(symbol)
         
         logger.info(
-            f"Executing BUY for {symbol} variant {variant}: "
-            f"qty={quantity}, price={price:.2f}"
+            "Executing BUY for %s variant %s: qty=%s, price=%.2f",
+            symbol, variant, quantity, price
         )
         
         # Place market order
@@ -165,8 +300,10 @@ class OrderExecutor:
         )
         
         if "orderId" in response:
+            placed.set_result(response)
+            
             # Get fill price (use average if available, otherwise use input price)
-            fill_price = float(response.get("fills", [{}])[0].get("price", price)) if response.get("fills") else price
+            fill_price = _fill_price(response, price)
             
             # Update strategy position
             self.strategy_manager.enter_position(
@@ -186,15 +323,15 @@ class OrderExecutor:
                 variant=variant,
                 order_id=str(response["orderId"]),
                 status=response.get("status", "FILLED"),
-                notes=f"SMA/EMA crossover entry"
+                notes=ENTRY_NOTE
             )
             
             logger.info(
-                f"BUY executed for {symbol} variant {variant}: "
-                f"OrderID={response['orderId']}, Price={fill_price:.2f}"
+                "BUY executed for %s variant %s: OrderID=%s, Price=%.2f",
+                symbol, variant, response["orderId"], fill_price
             )
         else:
-            logger.error(f"BUY order failed: {response}")
+            logger.error("BUY order failed: %s", response)
         
         return response
     
@@ -203,7 +340,8 @@ class OrderExecutor:
         symbol: str,
         variant: str,
         price: float,
-        position
+        position,
+        placed: asyncio.Future
     ) -> Optional[Dict[str, Any]]:
         """
         Execute a SELL signal.
@@ -213,20 +351,25 @@ class OrderExecutor:
             variant: Strategy variant
             price: Current price
             position: Current position state
+            placed: Ledger future, resolved with the response once the
+                order has been placed
             
         Returns:
             Order response if successful
         """
         # Don't sell if not in position
         if not position or position.side != "LONG":
-            logger.info(f"No LONG position to close for {symbol} variant {variant}")
+            logger.info("No LONG position to close for %s variant %s", symbol, variant)
             return None
         
         quantity = position.quantity
         
+        # Determine exit reason while the position is still open
+        exit_reason = STOP_LOSS_NOTE if position.is_stop_loss_triggered() else EXIT_NOTE
+        
         logger.info(
-            f"Executing SELL for {symbol} variant {variant}: "
-            f"qty={quantity}, price={price:.2f}"
+            "Executing SELL for %s variant %s: qty=%s, price=%.2f",
+            symbol, variant, quantity, price
         )
         
         # Place market order
@@ -237,8 +380,10 @@ class OrderExecutor:
         )
         
         if "orderId" in response:
+            placed.set_result(response)
+            
             # Get fill price
-            fill_price = float(response.get("fills", [{}])[0].get("price", price)) if response.get("fills") else price
+            fill_price = _fill_price(response, price)
             
             # Exit position and get P&L
             pnl = self.strategy_manager.exit_position(
@@ -247,11 +392,6 @@ class OrderExecutor:
                 price=fill_price
             )
             
-            # Determine exit reason
-            exit_reason = "SMA/EMA crossover exit"
-            if position.is_stop_loss_triggered():
-                exit_reason = "Stop Loss triggered"
-            
             # Log trade
             self.trade_logger.log_trade(
                 symbol=symbol,
@@ -266,11 +406,11 @@ class OrderExecutor:
             )
             
             logger.info(
-                f"SELL executed for {symbol} variant {variant}: "
-                f"OrderID={response['orderId']}, Price={fill_price:.2f}, P&L={pnl:.4f}"
+                "SELL executed for %s variant %s: OrderID=%s, Price=%.2f, P&L=%.4f",
+                symbol, variant, response["orderId"], fill_price, pnl
             )
         else:
-            logger.error(f"SELL order failed: {response}")
+            logger.error("SELL order failed: %s", response)
         
         return response
     
@@ -284,6 +424,10 @@ class OrderExecutor:
         """
         Callback for strategy signals (creates async task).
         
+        The task is kept in an in-flight set until it finishes so it is
+        not garbage collected mid-order; concurrency is bounded inside
+        execute_signal.
+        
         Args:
             symbol: Trading symbol
             variant: Strategy variant
@@ -291,13 +435,16 @@ class OrderExecutor:
             price: Current price
         """
         if signal != Signal.HOLD:
-            asyncio.create_task(
+            task = asyncio.create_task(
                 self.execute_signal(symbol, variant, signal, price)
             )
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
     
     async def close(self) -> None:
         """Close the order executor and its clients."""
         await self.order_client.close()
+        self.trade_logger.close()
         logger.info("Order executor closed")
     
     def get_trade_history(
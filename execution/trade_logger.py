@@ -2,70 +2,582 @@
 Trade Logger for Persisting Trade History.
 
 This module provides functionality to log and persist trade information
-to a JSON file for later analysis.
+to a newline-delimited JSON (NDJSON) file for later analysis.
 """
 
-import json
+import asyncio
+import glob
+import gzip
 import os
+import queue
+import shutil
 import threading
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import time
+from collections import defaultdict, deque
+from typing import BinaryIO, Iterator, List, Optional, Dict, Any, Tuple
 import logging
+import orjson
 
 from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum trade records waiting for the writer thread
+TRADE_QUEUE_SIZE = 10_000
+
+# fdatasync skips the metadata flush where available (Linux); fall back to fsync
+_fsync = getattr(os, "fdatasync", os.fsync)
+
+# Records parsed per orjson call when loading the log
+LOAD_BATCH_SIZE = 1000
+
+# Bytes read per step when scanning the log backwards for older trades
+SCAN_BLOCK_SIZE = 64 * 1024
+
+# Fast gzip level for rotated logs; NDJSON compresses well even at level 1
+ARCHIVE_COMPRESSLEVEL = 1
+
+# Writer-queue markers for close() and clear()
+_CLOSE = object()
+_TRUNCATE = object()
+
+
+def _read_lines_reversed(f: BinaryIO) -> Iterator[bytes]:
+    """
+    Yield the non-blank lines of a binary file, last line first.
+    
+    Args:
+        f: File opened for binary reading
+        
+    Yields:
+        Lines without their trailing newline
+    """
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    tail = b""
+    while pos > 0:
+        step = min(SCAN_BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + tail).split(b"\n")
+        # The first piece may continue in the previous block
+        tail = lines.pop(0)
+        for line in reversed(lines):
+            if line.strip():
+                yield line
+    if tail.strip():
+        yield tail
+
+
+class _TradeStats:
+    """Running summary statistics for one (symbol, variant) filter."""
+    
+    __slots__ = ("total", "buys", "sells", "pnl_count", "total_pnl", "winning", "losing")
+    
+    def __init__(self):
+        self.total = 0
+        self.buys = 0
+        self.sells = 0
+        self.pnl_count = 0
+        self.total_pnl = 0
+        self.winning = 0
+        self.losing = 0
+    
+    def add(self, trade: Dict[str, Any]) -> None:
+        """Fold one trade record into the statistics."""
+        self.total += 1
+        side = trade.get("side")
+        if side == "BUY":
+            self.buys += 1
+        elif side == "SELL":
+            self.sells += 1
+        pnl = trade.get("pnl")
+        if pnl is not None:
+            self.pnl_count += 1
+            self.total_pnl += pnl
+            if pnl > 0:
+                self.winning += 1
+            elif pnl < 0:
+                self.losing += 1
+    
+    def matching(self, side: Optional[str]) -> int:
+        """
+        Count trades with the given side (any side if None).
+        
+        Args:
+            side: Upper-case trade side
+            
+        Returns:
+            Number of trades, an upper bound for unknown sides
+        """
+        if side == "BUY":
+            return self.buys
+        if side == "SELL":
+            return self.sells
+        return self.total
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the get_summary() result format."""
+        return {
+            "total_trades": self.total,
+            "buy_trades": self.buys,
+            "sell_trades": self.sells,
+            "total_pnl": self.total_pnl,
+            "winning_trades": self.winning,
+            "losing_trades": self.losing,
+            "win_rate": self.winning / self.pnl_count if self.pnl_count else 0.0
+        }
+
 
 class TradeLogger:
     """
-    Logger for persisting trade information to JSON file.
+    Logger for persisting trade information to an NDJSON file.
     
     Each trade record includes timestamp, symbol, side, size, price,
-    and strategy variant information.
+    and strategy variant information. Records are appended one per line,
+    so logging a trade writes only that trade. Disk I/O happens on a
+    background writer thread: log_trade() only queues the record, and the
+    writer appends whatever has queued up in one write.
+    
+    Durability is opt-in. By default written records are handed to the OS
+    but not synced, so an OS crash or power loss (not a process crash) can
+    lose the most recent trades; syncing costs milliseconds per batch.
+    Pass auto_file_sync=True to sync after every batch, or call
+    file_sync() at points that must be durable. close() always syncs.
+    
+    Trades are also indexed by symbol, variant and (symbol, variant), and
+    summary statistics are kept up to date as trades are logged, so
+    filtered queries and summaries do not scan the full history.
+    
+    Only the most recent hot_window trades are kept in memory. Queries
+    that need older trades read them back from the end of the log file;
+    summaries always cover the full history.
+    
+    Once the log file reaches max_bytes it is rotated to
+    '<name>.<epoch ms><ext>', gzipped in the background and the newest
+    backups archives are kept. Archives are not read back: after a
+    restart, history and summaries cover the active log file.
+    
+    The in-memory trades, indices and statistics are owned by the event
+    loop thread: log_trade(), the queries and clear() must all be called
+    from it, so they need no lock. The writer thread only ever sees the
+    queue and the file.
     
     Attributes:
-        log_file: Path to the JSON log file
-        _trades: In-memory list of trades
-        _lock: Threading lock for thread-safe access
+        log_file: Path to the NDJSON log file
+        auto_file_sync: Whether every written batch is synced to disk
+        hot_window: Number of most recent trades kept in memory
+        max_bytes: Log file size that triggers rotation (0 disables)
+        backups: Number of rotated archives to keep
+        _trades: In-memory list of the most recent trades
+        _truncated: Whether older trades exist only in the log file
+        _by_symbol: Trades per symbol, in log order
+        _by_variant: Trades per strategy variant, in log order
+        _by_symbol_variant: Trades per (symbol, variant), in log order
+        _stats: Running statistics per (symbol or None, variant or None)
+        _fp: Log file, open for appending (used by the writer thread only)
+        _queue: Records and markers waiting for the writer thread
+        _writer: Background thread that writes queued records
+        _compactor: Thread compressing the last rotated log, if any
+        _written: Records appended to the log since it was loaded, counting
+            the loaded ones (writer thread only)
+        _file_first: Position in the history of the first record in the
+            active log file; older records were rotated out
     """
     
-    def __init__(self, log_file: Optional[str] = None):
+    def __init__(
+        self,
+        log_file: Optional[str] = None,
+        auto_file_sync: bool = False,
+        hot_window: Optional[int] = None
+    ):
         """
         Initialize the trade logger.
         
         Args:
             log_file: Path to log file (uses config default if not specified)
+            auto_file_sync: Sync the file to disk after every written batch
+            hot_window: Recent trades kept in memory (uses config default
+                if not specified)
         """
         self.settings = get_settings()
         self.log_file = log_file or self.settings.trade_log_file
+        self.auto_file_sync = auto_file_sync
+        self.hot_window = hot_window or self.settings.trade_log_hot_window
+        self.max_bytes = self.settings.trade_log_max_bytes
+        self.backups = self.settings.trade_log_backups
         self._trades: List[Dict[str, Any]] = []
-        self._lock = threading.RLock()
+        self._truncated = False
+        self._by_symbol: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_variant: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_symbol_variant: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        self._stats: Dict[Tuple[Optional[str], Optional[str]], _TradeStats] = defaultdict(_TradeStats)
+        self._queue: queue.Queue = queue.Queue(maxsize=TRADE_QUEUE_SIZE)
+        # (second, formatted date/time prefix) of the last timestamp
+        self._iso_cache: Tuple[int, str] = (0, "")
         
         # Load existing trades if file exists
         self._load_trades()
+        self._fp = open(self.log_file, "ab")
+        self._written = len(self)
+        self._file_first = 0
+        self._compactor: Optional[threading.Thread] = None
+        
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="trade-log-writer", daemon=True
+        )
+        self._writer.start()
         
         logger.info(f"Trade logger initialized with file: {self.log_file}")
     
     def _load_trades(self) -> None:
-        """Load existing trades from the log file."""
-        if os.path.exists(self.log_file):
-            try:
-                with open(self.log_file, 'r') as f:
-                    self._trades = json.load(f)
-                logger.info(f"Loaded {len(self._trades)} existing trades from log")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load existing trades: {e}")
-                self._trades = []
-    
-    def _save_trades(self) -> None:
-        """Save all trades to the log file."""
+        """
+        Load existing trades from the log file.
+        
+        Streams the file one record per line, counting every trade into the
+        summary statistics but keeping only the last hot_window in memory.
+        A log in the older format (a single JSON array) is loaded and
+        rewritten as NDJSON. Lines that fail to parse, such as a record torn
+        by a crash mid-write, are skipped and dropped from the file so later
+        appends start on a clean line.
+        """
+        if not os.path.exists(self.log_file):
+            return
+        
+        recent: deque = deque(maxlen=self.hot_window)
+        try:
+            with open(self.log_file, 'rb') as f:
+                if f.read(64).lstrip().startswith(b"["):
+                    f.seek(0)
+                    try:
+                        trades = orjson.loads(f.read())
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"Could not load existing trades: {e}")
+                        return
+                    self._trades = trades
+                    self._rewrite()
+                    self._trades = []
+                    damaged = False
+                    self._load_batch(trades, recent)
+                else:
+                    f.seek(0)
+                    damaged = False
+                    batch: List[bytes] = []
+                    line = b"\n"
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        batch.append(line)
+                        if len(batch) >= LOAD_BATCH_SIZE:
+                            damaged |= self._parse_batch(batch, recent)
+                            batch = []
+                    if batch:
+                        damaged |= self._parse_batch(batch, recent)
+                    damaged |= not line.endswith(b"\n")
+        except IOError as e:
+            logger.warning(f"Could not load existing trades: {e}")
+            return
+        
+        self._trades = list(recent)
+        for trade in self._trades:
+            self._index(trade)
+        loaded = len(self)
+        self._truncated = loaded > len(self._trades)
+        
+        if damaged:
+            self._repair()
+        
+        logger.info(
+            f"Loaded {len(self._trades)} of {loaded} existing trades from log"
+        )
+    
+    def _parse_batch(self, lines: List[bytes], recent: deque) -> bool:
+        """
+        Parse a batch of NDJSON lines and load the trades.
+        
+        Args:
+            lines: Non-blank log lines
+            recent: Window of most recent trades to append to
+            
+        Returns:
+            True if any line could not be parsed
+        """
+        damaged = False
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self._trades, f, indent=2, default=str)
+            # Parse the whole batch in one call; fall back to line by line
+            # only if some record is unreadable
+            trades = orjson.loads(b"[" + b",".join(lines) + b"]")
+        except orjson.JSONDecodeError:
+            trades = []
+            for line in lines:
+                try:
+                    trades.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable trade record: {line[:80]!r}")
+                    damaged = True
+        self._load_batch(trades, recent)
+        return damaged
+    
+    def _load_batch(self, trades: List[Dict[str, Any]], recent: deque) -> None:
+        """
+        Count loaded trades into the statistics and the recent window.
+        
+        Args:
+            trades: Trade records in log order
+            recent: Window of most recent trades to append to
+        """
+        for trade in trades:
+            self._stats_for(trade)
+        recent.extend(trades)
+    
+    def _index(self, trade: Dict[str, Any]) -> None:
+        """
+        Add an in-memory trade to the lookup indices.
+        
+        Must be called from the event loop thread (or before the logger is shared).
+        
+        Args:
+            trade: Trade record, shared by reference with _trades
+        """
+        symbol = trade.get("symbol")
+        variant = trade.get("variant")
+        self._by_symbol[symbol].append(trade)
+        self._by_variant[variant].append(trade)
+        self._by_symbol_variant[(symbol, variant)].append(trade)
+    
+    def _stats_for(self, trade: Dict[str, Any]) -> None:
+        """
+        Add a trade to the running statistics.
+        
+        Must be called from the event loop thread (or before the logger is shared).
+        
+        Args:
+            trade: Trade record
+        """
+        symbol = trade.get("symbol")
+        variant = trade.get("variant")
+        for key in ((symbol, variant), (symbol, None), (None, variant), (None, None)):
+            self._stats[key].add(trade)
+    
+    def _evict_oldest(self) -> None:
+        """Drop the oldest in-memory trade; it remains in the log file."""
+        oldest = self._trades.pop(0)
+        symbol = oldest.get("symbol")
+        variant = oldest.get("variant")
+        for index, key in (
+            (self._by_symbol, symbol),
+            (self._by_variant, variant),
+            (self._by_symbol_variant, (symbol, variant))
+        ):
+            # Index lists are in log order, so the oldest trade is first
+            bucket = index[key]
+            del bucket[0]
+            if not bucket:
+                del index[key]
+        self._truncated = True
+    
+    def _rewrite(self) -> None:
+        """Replace the log file with all in-memory trades as NDJSON."""
+        try:
+            with open(self.log_file, 'wb') as f:
+                f.write(b"".join(self._encode(trade) for trade in self._trades))
         except IOError as e:
             logger.error(f"Failed to save trades: {e}")
     
+    def _repair(self) -> None:
+        """Rewrite the log file keeping only its readable records."""
+        tmp_file = self.log_file + ".tmp"
+        try:
+            with open(self.log_file, 'rb') as src, open(tmp_file, 'wb') as dst:
+                for line in src:
+                    if not line.strip():
+                        continue
+                    try:
+                        orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    dst.write(line.rstrip(b"\r\n") + b"\n")
+            os.replace(tmp_file, self.log_file)
+        except IOError as e:
+            logger.error(f"Failed to repair trade log: {e}")
+    
+    @staticmethod
+    def _encode(trade: Dict[str, Any]) -> bytes:
+        """Encode a trade record as one NDJSON line."""
+        return orjson.dumps(trade, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    
+    def _writer_loop(self) -> None:
+        """Write queued trade records to the log file until closed."""
+        while True:
+            # Block for the first item, then take everything else queued
+            # so the whole batch costs one write and one fsync
+            batch = [self._queue.get()]
+            try:
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            closing = self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if closing:
+                return
+    
+    def _write_batch(self, batch: List[Any]) -> bool:
+        """
+        Append a batch of queued records to the log file.
+        
+        Args:
+            batch: Trade records and writer markers, in queue order
+            
+        Returns:
+            True if the batch contained the close marker
+        """
+        lines = bytearray()
+        closing = False
+        try:
+            for item in batch:
+                if item is _CLOSE:
+                    closing = True
+                elif item is _TRUNCATE:
+                    # Records queued before clear() are discarded with the file
+                    lines.clear()
+                    self._fp.truncate(0)
+                    self._written = 0
+                    self._file_first = 0
+                else:
+                    lines += self._encode(item)
+                    self._written += 1
+            
+            if lines:
+                self._fp.write(lines)
+                self._fp.flush()
+                if self.auto_file_sync:
+                    _fsync(self._fp.fileno())
+                if self.max_bytes and self._fp.tell() >= self.max_bytes:
+                    self._rotate()
+        except (IOError, ValueError) as e:
+            logger.error(f"Failed to save trades: {e}")
+        return closing
+    
+    def _rotate(self) -> None:
+        """
+        Move the full log file aside and start a new one.
+        
+        Runs on the writer thread. The rotated file is compressed and old
+        archives pruned on a separate thread so writes are not held up.
+        """
+        base, ext = os.path.splitext(self.log_file)
+        stamp = time.time_ns() // 1_000_000
+        # Never reuse the name of an earlier rotation in the same millisecond
+        while os.path.exists(f"{base}.{stamp}{ext}") or os.path.exists(f"{base}.{stamp}{ext}.gz"):
+            stamp += 1
+        rotated = f"{base}.{stamp}{ext}"
+        
+        self._fp.close()
+        try:
+            os.replace(self.log_file, rotated)
+            # Everything written so far left with the rotated file
+            self._file_first = self._written
+        finally:
+            self._fp = open(self.log_file, "ab")
+        logger.info(f"Rotated trade log to {rotated}")
+        
+        # Compress one archive at a time
+        if self._compactor is not None:
+            self._compactor.join()
+        self._compactor = threading.Thread(
+            target=self._compact, args=(rotated,), name="trade-log-compactor", daemon=True
+        )
+        self._compactor.start()
+    
+    def _compact(self, rotated: str) -> None:
+        """
+        Gzip a rotated log file and prune the oldest archives.
+        
+        Args:
+            rotated: Path of the rotated NDJSON file
+        """
+        archive = rotated + ".gz"
+        try:
+            # Write under a temporary name so a partial archive never
+            # replaces the rotated file
+            with open(rotated, 'rb') as src, gzip.open(
+                archive + ".tmp", 'wb', compresslevel=ARCHIVE_COMPRESSLEVEL
+            ) as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(archive + ".tmp", archive)
+            os.remove(rotated)
+        except OSError as e:
+            logger.error(f"Failed to compress {rotated}: {e}")
+        
+        self._prune_archives()
+    
+    def _prune_archives(self) -> None:
+        """Delete rotated logs beyond the newest `backups`."""
+        base, ext = os.path.splitext(self.log_file)
+        archives = []
+        for path in glob.glob(f"{glob.escape(base)}.*{ext}*"):
+            stamp = path[len(base) + 1:].removesuffix(".gz").removesuffix(ext)
+            if stamp.isdigit():
+                archives.append((int(stamp), path))
+        
+        archives.sort()
+        for _, path in archives[:-self.backups or None]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.error(f"Failed to remove old trade log {path}: {e}")
+    
+    def _enqueue(self, item: Any) -> None:
+        """Hand a trade record to the writer thread without blocking."""
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.error("Trade log writer is falling behind; record kept in memory only")
+    
+    def flush(self) -> None:
+        """Block until every queued trade record has been written to the file."""
+        if self._writer.is_alive():
+            self._queue.join()
+    
+    def file_sync(self) -> None:
+        """Write every queued trade record and sync the log file to disk."""
+        self.flush()
+        try:
+            _fsync(self._fp.fileno())
+        except (IOError, ValueError) as e:
+            logger.error(f"Failed to sync trade log: {e}")
+    
+    def close(self) -> None:
+        """Write and sync queued trade records, stop the writer and close the file."""
+        if not self._writer.is_alive():
+            return
+        self._queue.put(_CLOSE)
+        self._writer.join()
+        self.file_sync()
+        self._fp.close()
+        if self._compactor is not None:
+            self._compactor.join()
+    
+    def _now_iso(self) -> str:
+        """
+        Get the current UTC time as an ISO 8601 string.
+        
+        The date and time up to the second is formatted once per second
+        and reused; only the microseconds are formatted per call.
+        
+        Returns:
+            Timestamp like '2024-01-01T12:00:00.123456'
+        """
+        sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+        cached_sec, prefix = self._iso_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._iso_cache = (sec, prefix)
+        return f"{prefix}.{us:06d}"
+    
     def log_trade(
         self,
         symbol: str,
@@ -96,7 +608,7 @@ class TradeLogger:
             The logged trade record
         """
         trade = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._now_iso(),
             "symbol": symbol.upper(),
             "side": side.upper(),
             "size": size,
@@ -108,13 +620,16 @@ class TradeLogger:
             "notes": notes
         }
         
-        with self._lock:
-            self._trades.append(trade)
-            self._save_trades()
+        self._trades.append(trade)
+        self._index(trade)
+        self._stats_for(trade)
+        if len(self._trades) > self.hot_window:
+            self._evict_oldest()
+        self._enqueue(trade)
         
         logger.info(
-            f"Logged trade: {side} {size} {symbol} @ {price:.2f} "
-            f"(Variant {variant})"
+            "Logged trade: %s %s %s @ %.2f (Variant %s)",
+            side, size, symbol, price, variant
         )
         
         return trade
@@ -129,6 +644,9 @@ class TradeLogger:
         """
         Get trade history with optional filtering.
         
+        May read older trades back from the log file on the calling
+        thread; use get_trades_async() from the event loop.
+        
         Args:
             symbol: Filter by symbol
             variant: Filter by strategy variant
@@ -138,23 +656,161 @@ class TradeLogger:
         Returns:
             List of trade records
         """
-        with self._lock:
-            trades = self._trades.copy()
+        trades, scan = self._query(symbol, variant, side, limit)
+        if scan is not None:
+            return self._pick(trades, self._scan_log(*scan))
+        return trades
+    
+    async def get_trades_async(
+        self,
+        symbol: Optional[str] = None,
+        variant: Optional[str] = None,
+        side: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get trade history without blocking the event loop.
         
-        # Apply filters
-        if symbol:
-            trades = [t for t in trades if t["symbol"] == symbol.upper()]
+        Same as get_trades(), but waiting for the writer and reading the
+        log file happen in a worker thread.
         
-        if variant:
-            trades = [t for t in trades if t["variant"] == variant]
+        Args:
+            symbol: Filter by symbol
+            variant: Filter by strategy variant
+            side: Filter by trade side
+            limit: Maximum number of trades to return (most recent)
+            
+        Returns:
+            List of trade records
+        """
+        trades, scan = self._query(symbol, variant, side, limit)
+        if scan is not None:
+            # The scan only touches the queue and the file, never the
+            # loop-owned indices, so it is safe off-loop
+            return self._pick(trades, await asyncio.to_thread(self._scan_log, *scan))
+        return trades
+    
+    def _query(
+        self,
+        symbol: Optional[str],
+        variant: Optional[str],
+        side: Optional[str],
+        limit: Optional[int]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[Any, ...]]]:
+        """
+        Collect the in-memory matches and decide whether to scan the log.
+        
+        Args:
+            symbol: Filter by symbol
+            variant: Filter by strategy variant
+            side: Filter by trade side
+            limit: Maximum number of trades to return (most recent)
+            
+        Returns:
+            The in-memory matches (limited), and the _scan_log() arguments
+            if older matches may be in the log file, else None
+        """
+        symbol = symbol.upper() if symbol else None
+        
+        # Start from the narrowest index covering the filters
+        if symbol and variant:
+            source = self._by_symbol_variant.get((symbol, variant), [])
+        elif symbol:
+            source = self._by_symbol.get(symbol, [])
+        elif variant:
+            source = self._by_variant.get(variant, [])
+        else:
+            source = self._trades
         
         if side:
-            trades = [t for t in trades if t["side"] == side.upper()]
+            side = side.upper()
+            trades = [t for t in source if t["side"] == side]
+            available = len(trades)
+        else:
+            available = len(source)
+            # Copy only the rows being returned
+            trades = source[-limit:] if limit else source.copy()
         
         # Apply limit
         if limit:
             trades = trades[-limit:]
         
+        # Older matches exist only in the log file if the full-history
+        # statistics count more than memory holds, and the active file
+        # still reaches back past the oldest trade in memory
+        older = False
+        if self._truncated and self._file_first < len(self) - len(self._trades):
+            stats = self._stats.get((symbol, variant or None))
+            older = stats is not None and stats.matching(side) > available
+        
+        if older and (not limit or available < limit):
+            return trades, (symbol, variant, side, limit)
+        return trades, None
+    
+    @staticmethod
+    def _pick(
+        trades: List[Dict[str, Any]],
+        scanned: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Choose between the in-memory matches and the log scan.
+        
+        Memory and the active file both hold the newest trades, so the
+        longer result covers the other (a rotation may have emptied the
+        file since the scan was decided on).
+        
+        Args:
+            trades: In-memory matches, limited
+            scanned: Matches read from the log file, limited
+            
+        Returns:
+            The more complete of the two
+        """
+        return scanned if len(scanned) >= len(trades) else trades
+    
+    def _scan_log(
+        self,
+        symbol: Optional[str],
+        variant: Optional[str],
+        side: Optional[str],
+        limit: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Read matching trades from the log file, newest first.
+        
+        Args:
+            symbol: Upper-case symbol filter
+            variant: Variant filter
+            side: Upper-case side filter
+            limit: Stop after this many matches
+            
+        Returns:
+            Matching trade records, oldest first
+        """
+        # Make sure everything logged so far is in the file
+        self.flush()
+        
+        trades = []
+        try:
+            with open(self.log_file, 'rb') as f:
+                for line in _read_lines_reversed(f):
+                    try:
+                        trade = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    if (
+                        (symbol and trade.get("symbol") != symbol)
+                        or (variant and trade.get("variant") != variant)
+                        or (side and trade.get("side") != side)
+                    ):
+                        continue
+                    trades.append(trade)
+                    if limit and len(trades) >= limit:
+                        break
+        except IOError as e:
+            logger.error(f"Failed to read trade log: {e}")
+        
+        trades.reverse()
         return trades
     
     def get_summary(self, symbol: Optional[str] = None, variant: Optional[str] = None) -> Dict[str, Any]:
@@ -168,44 +824,34 @@ class TradeLogger:
         Returns:
             Summary statistics including total trades, P&L, etc.
         """
-        trades = self.get_trades(symbol=symbol, variant=variant)
-        
-        if not trades:
-            return {
-                "total_trades": 0,
-                "buy_trades": 0,
-                "sell_trades": 0,
-                "total_pnl": 0.0,
-                "winning_trades": 0,
-                "losing_trades": 0
-            }
-        
-        buy_trades = [t for t in trades if t["side"] == "BUY"]
-        sell_trades = [t for t in trades if t["side"] == "SELL"]
+        key = (symbol.upper() if symbol else None, variant or None)
         
-        pnl_trades = [t for t in trades if t.get("pnl") is not None]
-        total_pnl = sum(t["pnl"] for t in pnl_trades)
-        winning = len([t for t in pnl_trades if t["pnl"] > 0])
-        losing = len([t for t in pnl_trades if t["pnl"] < 0])
+        stats = self._stats.get(key)
+        if stats is not None:
+            return stats.to_dict()
         
         return {
-            "total_trades": len(trades),
-            "buy_trades": len(buy_trades),
-            "sell_trades": len(sell_trades),
-            "total_pnl": total_pnl,
-            "winning_trades": winning,
-            "losing_trades": losing,
-            "win_rate": winning / len(pnl_trades) if pnl_trades else 0.0
+            "total_trades": 0,
+            "buy_trades": 0,
+            "sell_trades": 0,
+            "total_pnl": 0.0,
+            "winning_trades": 0,
+            "losing_trades": 0
         }
     
     def clear(self) -> None:
         """Clear all trade history."""
-        with self._lock:
-            self._trades = []
-            self._save_trades()
+        self._trades = []
+        self._truncated = False
+        self._by_symbol.clear()
+        self._by_variant.clear()
+        self._by_symbol_variant.clear()
+        self._stats.clear()
+        # Unlike a record, the truncate must not be dropped on a full queue
+        self._queue.put(_TRUNCATE)
         logger.info("Trade history cleared")
     
     def __len__(self) -> int:
         """Return total number of logged trades."""
-        with self._lock:
-            return len(self._trades)
+        stats = self._stats.get((None, None))
+        return stats.total if stats else 0
@@ -464,7 +464,10 @@ function connectWebSocket() {
 }
 
 function handleWebSocketMessage(data) {
-    if (data.type === 'candle') {
+    if (data.type === 'batch') {
+        // Coalesced broadcasts: handle each item as if sent on its own
+        data.items.forEach(handleWebSocketMessage);
+    } else if (data.type === 'candle') {
         // Real-time candle update
         if (data.symbol === state.selectedSymbol) {
             fetchCandles(state.selectedSymbol);
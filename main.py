@@ -15,14 +15,22 @@ Components:
 """
 
 import asyncio
+import os
+import queue
 import signal
 import sys
 import logging
+import logging.handlers
 from typing import Optional
 
 import uvicorn
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # uvicorn[standard] doesn't install uvloop on Windows
+    uvloop = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -37,16 +45,30 @@ from execution.trade_logger import TradeLogger
 from api.rest_api import create_app
 from api.websocket_server import WebSocketServer
 
-# Configure logging
+# Configure logging. Records are queued and written to stdout by a
+# listener thread (started in main()), so log I/O never blocks the loop
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_output = logging.StreamHandler(sys.stdout)
+_log_output.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+_log_input = logging.handlers.QueueHandler(_log_queue)
+# Queue the bare message; the listener's handler adds time, name and level
+_log_input.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
+        _log_input
+    ],
+    # Replace the default handler installed when the stream client is imported
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+# Closed candles waiting for strategy evaluation
+CANDLE_QUEUE_SIZE = 1024
+
 
 class CryptoTradingSystem:
     """
@@ -97,6 +119,11 @@ class CryptoTradingSystem:
         # Wire up callbacks
         self._setup_callbacks()
         
+        # Closed candles are evaluated by a background task so strategies
+        # never run inside the aggregator's tick path
+        self._candle_queue: asyncio.Queue = asyncio.Queue(maxsize=CANDLE_QUEUE_SIZE)
+        self._candle_task: Optional[asyncio.Task] = None
+        
         # Shutdown flag
         self._shutdown = False
         
@@ -105,7 +132,11 @@ class CryptoTradingSystem:
     def _setup_callbacks(self):
         """Set up callbacks between components."""
         # Tick -> OHLC Aggregator
-        self.stream_client.add_tick_callback(self.ohlc_aggregator.process_tick)
+        self.ohlc_aggregator.register_symbols(self.settings.symbols)
+        self.tick_store.subscribe(self.ohlc_aggregator.process_tick)
+        
+        # Tick -> stop-loss checks on open positions
+        self.tick_store.subscribe(self.strategy_manager.on_tick)
         
         # Candle -> Strategy Manager
         self.ohlc_aggregator.add_candle_callback(self._on_candle)
@@ -120,15 +151,45 @@ class CryptoTradingSystem:
         self.strategy_manager.add_signal_callback(self.ws_server.on_signal)
     
     def _on_candle(self, candle):
-        """Handle new closed candle."""
+        """Handle new closed candle (queues it for strategy evaluation)."""
+        try:
+            self._candle_queue.put_nowait(candle)
+        except asyncio.QueueFull:
+            # Drop the oldest candle rather than stall the aggregator
+            dropped = self._candle_queue.get_nowait()
+            logger.warning(f"Candle queue full, dropped {dropped.symbol} candle")
+            self._candle_queue.put_nowait(candle)
+    
+    def _process_candles(self, candles):
+        """Run strategies on a batch of closed candles and log the signals."""
         # Forward to strategy manager
-        signals = self.strategy_manager.on_candle(candle)
+        signals = self.strategy_manager.on_candles(candles)
         
         for symbol, variant, sig in signals:
             logger.info(f"Signal generated: {symbol} {variant} -> {sig.value}")
     
+    def _drain_candles(self, first=None):
+        """Take every queued candle (after first, if given) as one batch."""
+        batch = [first] if first is not None else []
+        candle_queue = self._candle_queue
+        while not candle_queue.empty():
+            batch.append(candle_queue.get_nowait())
+        return batch
+    
+    async def _candle_consumer(self):
+        """Evaluate queued candles until cancelled."""
+        while True:
+            # Candles for all symbols close together at the minute boundary;
+            # wake once and evaluate everything queued so far as one batch
+            batch = self._drain_candles(await self._candle_queue.get())
+            try:
+                self._process_candles(batch)
+            except Exception as e:
+                logger.error(f"Error processing candles: {e}")
+    
     async def _add_symbol(self, symbol: str):
         """Add a new symbol to track."""
+        self.ohlc_aggregator.register_symbols([symbol])
         await self.stream_client.subscribe(symbol)
     
     async def _remove_symbol(self, symbol: str):
@@ -166,6 +227,7 @@ class CryptoTradingSystem:
                 logger.warning("Binance Testnet REST API: Connection failed")
         
         # Start components
+        self._candle_task = asyncio.create_task(self._candle_consumer())
         await self.ohlc_aggregator.start()
         await self.ws_server.start()
         
@@ -178,7 +240,13 @@ class CryptoTradingSystem:
             host=self.settings.api_host,
             port=self.settings.api_port,
             log_level="info",
-            access_log=False
+            access_log=False,
+            # uvicorn runs inside our loop, so its loop= setting would be
+            # ignored; main() picks uvloop instead
+            http="httptools",
+            # Outlast the dashboard's slowest poll (30 s) and common proxy
+            # idle timeouts (60 s) so polls reuse open connections
+            timeout_keep_alive=65
         )
         server = uvicorn.Server(config)
         api_task = asyncio.create_task(server.serve())
@@ -216,6 +284,19 @@ class CryptoTradingSystem:
         
         await self.stream_client.stop()
         await self.ohlc_aggregator.stop()
+        
+        # Evaluate candles closed during shutdown, then stop the consumer
+        if self._candle_task:
+            self._candle_task.cancel()
+            try:
+                await self._candle_task
+            except asyncio.CancelledError:
+                pass
+        try:
+            self._process_candles(self._drain_candles())
+        except Exception as e:
+            logger.error(f"Error processing candles: {e}")
+        
         await self.ws_server.stop()
         await self.order_executor.close()
         
@@ -226,9 +307,43 @@ class CryptoTradingSystem:
         self._shutdown = True
 
 
+def _pin_cpus(spec: str) -> None:
+    """
+    Pin the process to the given CPUs.
+    
+    Keeps the event loop thread on warm caches instead of being migrated
+    between cores by the scheduler.
+    
+    Args:
+        spec: Comma-separated CPU ids (e.g. "0" or "0,1"); empty to skip
+    """
+    if not spec:
+        return
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("CPU affinity is not supported on this platform")
+        return
+    try:
+        cpus = {int(cpu) for cpu in spec.split(",") if cpu.strip()}
+        os.sched_setaffinity(0, cpus)
+        logger.info(f"Pinned process to CPUs {sorted(cpus)}")
+    except (ValueError, OSError) as e:
+        logger.warning(f"Could not set CPU affinity {spec!r}: {e}")
+
+
 def main():
     """Main entry point."""
+    _log_listener.start()
+    try:
+        _run()
+    finally:
+        # Write out any queued log records
+        _log_listener.stop()
+
+
+def _run():
+    """Create and run the trading system until shutdown."""
     system = CryptoTradingSystem()
+    _pin_cpus(system.settings.cpu_affinity)
     
     # Handle signals
     def signal_handler(sig, frame):
@@ -238,9 +353,12 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Run the system
+    # Run the system (on uvloop's libuv event loop when available)
+    run = uvloop.run if uvloop is not None else asyncio.run
+    if uvloop is None:
+        logger.info("uvloop not available, using the default asyncio event loop")
     try:
-        asyncio.run(system.start())
+        run(system.start())
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
@@ -9,9 +9,9 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Optional
 
-from aggregation.models import OHLCCandle
+from aggregation.models import OHLCCandle, normalize_symbol
 
 
 class Signal(Enum):
@@ -21,7 +21,14 @@ class Signal(Enum):
     HOLD = "HOLD"
 
 
-@dataclass
+# Signal members bound once: Signal.X goes through the enum metaclass on
+# every access, which is several times slower than a global lookup
+SIGNAL_BUY = Signal.BUY
+SIGNAL_SELL = Signal.SELL
+SIGNAL_HOLD = Signal.HOLD
+
+
+@dataclass(slots=True)
 class Position:
     """
     Represents a trading position.
@@ -99,18 +106,52 @@ class BaseStrategy(ABC):
             symbol: Trading symbol for this strategy
             stop_loss_pct: Stop loss percentage (e.g., 0.10 for 10%)
         """
-        self.symbol = symbol.upper()
+        self.symbol = normalize_symbol(symbol)
         self.stop_loss_pct = stop_loss_pct
         self.position = Position(symbol=self.symbol, side="FLAT")
-        self.candle_history: List[OHLCCandle] = []
+        # Closed candles seen so far (counts up to get_required_candles()),
+        # and whether that many have been seen
+        self._candles_seen = 0
+        self._warmed_up = False
+        # Set once the stop loss has been signalled for the open position
+        self._stop_signalled = False
+        # Minute of the newest candle applied, to reject replays
+        self._last_candle_minute: Optional[int] = None
+    
+    def reset_state(self) -> None:
+        """
+        Clear the rolling indicator state, keeping the position.
+        
+        For when upstream reports a gap that the incremental indicators
+        cannot bridge; signals resume once the strategy has warmed up
+        again. Subclasses with rolling state extend this.
+        """
+        self._candles_seen = 0
+        self._warmed_up = False
+        self._last_candle_minute = None
+    
+    def add_price(self, price: float) -> None:
+        """
+        Feed the closing price of every candle into the strategy state.
+        
+        Called for each candle before stop-loss and signal checks, so
+        rolling indicators see every price even when no signal is
+        calculated. The default implementation does nothing.
+        
+        Args:
+            price: Candle closing price
+        """
+        pass
     
     @abstractmethod
-    def calculate_signal(self, candles: List[OHLCCandle]) -> Signal:
+    def calculate_signal(self, price: float) -> Signal:
         """
-        Calculate trading signal based on candle data.
+        Calculate trading signal for the latest closing price.
+        
+        Only called once get_required_candles() candles have been seen.
         
         Args:
-            candles: List of OHLC candles (oldest to newest)
+            price: Closing price of the newest candle
             
         Returns:
             Trading signal (BUY, SELL, or HOLD)
@@ -137,29 +178,86 @@ class BaseStrategy(ABC):
         Returns:
             Signal if action should be taken, None otherwise
         """
-        if candle.symbol.upper() != self.symbol:
+        # Candle symbols are normalized (interned), so identity is the fast
+        # path; anything else is normalized before giving up
+        if (candle.symbol is not self.symbol
+                and normalize_symbol(candle.symbol) is not self.symbol):
             return None
         
-        # Add candle to history
-        self.candle_history.append(candle)
-        
-        # Trim history to required size + buffer
-        max_history = self.get_required_candles() * 2
-        if len(self.candle_history) > max_history:
-            self.candle_history = self.candle_history[-max_history:]
+        # Rolling indicators would double-count a replayed or out-of-order
+        # candle (e.g. after a reconnect), so only newer minutes are applied
+        ts_minute = candle.ts_minute
+        last_minute = self._last_candle_minute
+        if last_minute is not None and ts_minute <= last_minute:
+            return None
+        self._last_candle_minute = ts_minute
         
-        # Update position with current price
-        self.position.update_price(candle.close)
+        price = candle.close
+        self.add_price(price)
+        # Only count candles (and ask for the requirement) while warming up
+        warmed_up = self._warmed_up
+        if not warmed_up:
+            self._candles_seen += 1
+            warmed_up = self._warmed_up = (
+                self._candles_seen >= self.get_required_candles()
+            )
         
-        # Check for stop loss
-        if self.position.is_stop_loss_triggered():
-            return Signal.SELL
+        # Update position with current price and check for stop loss
+        # (Position.update_price / is_stop_loss_triggered, inlined)
+        position = self.position
+        position.current_price = price
+        if position.side == "LONG":
+            if position.entry_price > 0:
+                position.unrealized_pnl = (price - position.entry_price) * position.quantity
+            if 0 < price <= position.stop_loss_price:
+                # Signal the stop once per position, whether a tick or a
+                # candle close hits it first
+                if self._stop_signalled:
+                    return SIGNAL_HOLD
+                self._stop_signalled = True
+                return SIGNAL_SELL
         
         # Calculate signal if we have enough candles
-        if len(self.candle_history) >= self.get_required_candles():
-            return self.calculate_signal(self.candle_history)
+        if warmed_up:
+            return self.calculate_signal(price)
         
-        return Signal.HOLD
+        return SIGNAL_HOLD
+    
+    def on_tick(self, price: float) -> Optional[Signal]:
+        """
+        Check the stop loss against a live trade price.
+        
+        Runs between candle closes so a stop is acted on within a tick
+        instead of at the next closed bar. Indicators are not updated.
+        
+        Args:
+            price: Latest trade price
+            
+        Returns:
+            SELL the first time the stop loss is hit for the open position,
+            None otherwise
+        """
+        position = self.position
+        if position.side != "LONG":
+            return None
+        
+        position.current_price = price
+        if position.entry_price > 0:
+            position.unrealized_pnl = (price - position.entry_price) * position.quantity
+        if 0 < price <= position.stop_loss_price and not self._stop_signalled:
+            self._stop_signalled = True
+            return SIGNAL_SELL
+        
+        return None
+    
+    def rearm_stop_loss(self) -> None:
+        """
+        Let the stop loss be signalled again for the open position.
+        
+        For when the exit order for a signalled stop was not placed, so
+        the next tick or candle below the stop retries the exit.
+        """
+        self._stop_signalled = False
     
     def enter_position(self, price: float, quantity: float, timestamp: datetime) -> None:
         """
@@ -177,6 +275,7 @@ class BaseStrategy(ABC):
         self.position.current_price = price
         self.position.unrealized_pnl = 0.0
         self.position.stop_loss_price = price * (1 - self.stop_loss_pct)
+        self._stop_signalled = False
     
     def exit_position(self, price: float) -> float:
         """
@@ -200,6 +299,7 @@ class BaseStrategy(ABC):
         self.position.quantity = 0.0
         self.position.unrealized_pnl = 0.0
         self.position.stop_loss_price = 0.0
+        self._stop_signalled = False
         
         return pnl
     
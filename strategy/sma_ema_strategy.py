@@ -11,11 +11,13 @@ Strategy Logic:
 - SELL signal when EMA crosses below SMA (bearish crossover)
 """
 
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Optional
 import logging
 
-from aggregation.models import OHLCCandle
-from strategy.base_strategy import BaseStrategy, Signal
+from strategy.base_strategy import (
+    BaseStrategy, Signal, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_HOLD
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +33,10 @@ class SMAEMAStrategy(BaseStrategy):
     Attributes:
         sma_period: Period for Simple Moving Average calculation
         ema_period: Period for Exponential Moving Average calculation
-        _prev_ema: Previous EMA value for crossover detection
-        _prev_sma: Previous SMA value for crossover detection
+        _prev_sign: Side of the SMA the EMA was on at the previous candle
+            (1 above, -1 below, 0 equal), for crossover detection
+        _sma_window: Closing prices in the current SMA window
+        _sma_sum: Running sum of _sma_window
     """
     
     def __init__(
@@ -58,17 +62,23 @@ class SMAEMAStrategy(BaseStrategy):
         
         self.sma_period = sma_period
         self.ema_period = ema_period
-        self._prev_ema: Optional[float] = None
-        self._prev_sma: Optional[float] = None
+        self._prev_sign: Optional[int] = None
         self._current_ema: Optional[float] = None
         self._current_sma: Optional[float] = None
         
-        # EMA multiplier: 2 / (period + 1)
+        # Rolling SMA state: the window, its running sum, and updates left
+        # until the sum is recomputed exactly
+        self._sma_window: Deque[float] = deque(maxlen=sma_period)
+        self._sma_sum = 0.0
+        self._sma_resync = sma_period
+        
+        # EMA multiplier: 2 / (period + 1), and the weight of the previous EMA
         self._ema_multiplier = 2 / (ema_period + 1)
+        self._ema_decay = 1 - self._ema_multiplier
         
         logger.info(
-            f"Initialized SMA/EMA strategy for {symbol}: "
-            f"SMA={sma_period}, EMA={ema_period}, SL={stop_loss_pct*100:.1f}%"
+            "Initialized SMA/EMA strategy for %s: SMA=%d, EMA=%d, SL=%.1f%%",
+            symbol, sma_period, ema_period, stop_loss_pct * 100
         )
     
     def get_required_candles(self) -> int:
@@ -80,110 +90,92 @@ class SMAEMAStrategy(BaseStrategy):
         """
         return max(self.sma_period, self.ema_period) + 1
     
-    def _calculate_sma(self, prices: List[float], period: int) -> float:
+    def add_price(self, price: float) -> None:
         """
-        Calculate Simple Moving Average.
+        Add a closing price to the rolling SMA window.
         
-        SMA = Sum of last N prices / N
+        The running sum is recomputed from the window every N updates to
+        keep floating-point drift from accumulating.
         
         Args:
-            prices: List of prices
-            period: Number of periods
-            
-        Returns:
-            SMA value
+            price: Candle closing price
         """
-        if len(prices) < period:
-            return 0.0
-        return sum(prices[-period:]) / period
+        window = self._sma_window
+        if len(window) == self.sma_period:
+            self._sma_sum -= window[0]
+        window.append(price)
+        self._sma_sum += price
+        
+        self._sma_resync -= 1
+        if self._sma_resync <= 0:
+            self._sma_sum = sum(window)
+            self._sma_resync = self.sma_period
     
-    def _calculate_ema(self, current_price: float, previous_ema: Optional[float] = None) -> float:
+    def calculate_signal(self, price: float) -> Signal:
         """
-        Calculate Exponential Moving Average.
+        Calculate trading signal based on SMA/EMA crossover.
         
+        SMA = Sum of last N prices / N (from the rolling window)
         EMA = (Current Price × Multiplier) + (Previous EMA × (1 - Multiplier))
-        where Multiplier = 2 / (Period + 1)
-        
-        For the first EMA, use SMA as the starting point.
-        
-        Args:
-            current_price: Current closing price
-            previous_ema: Previous EMA value (or None for first calculation)
-            
-        Returns:
-            EMA value
-        """
-        if previous_ema is None:
-            # Use current price as starting EMA
-            return current_price
-        
-        return (current_price * self._ema_multiplier) + (previous_ema * (1 - self._ema_multiplier))
-    
-    def calculate_signal(self, candles: List[OHLCCandle]) -> Signal:
-        """
-        Calculate trading signal based on SMA/EMA crossover.
+        where Multiplier = 2 / (Period + 1); the first EMA is the price itself
         
         Strategy Rules:
         - BUY: When EMA crosses above SMA (bullish crossover)
         - SELL: When EMA crosses below SMA (bearish crossover)
         - HOLD: No crossover detected
         
+        The SMA and EMA updates are inlined and kept in locals; this runs
+        for every strategy on every closed candle.
+        
         Args:
-            candles: List of OHLC candles (oldest to newest)
+            price: Closing price of the newest candle
             
         Returns:
             Trading signal (BUY, SELL, or HOLD)
         """
-        if len(candles) < self.get_required_candles():
-            return Signal.HOLD
-        
-        # Extract closing prices
-        closes = [c.close for c in candles]
-        
-        # Store previous values for crossover detection
-        self._prev_ema = self._current_ema
-        self._prev_sma = self._current_sma
-        
-        # Calculate current SMA
-        self._current_sma = self._calculate_sma(closes, self.sma_period)
-        
-        # Calculate current EMA
-        self._current_ema = self._calculate_ema(closes[-1], self._prev_ema)
-        
-        # Need previous values to detect crossover
-        if self._prev_ema is None or self._prev_sma is None:
-            return Signal.HOLD
-        
-        # Detect crossover
-        # Bullish: EMA was below SMA, now EMA is above SMA
-        bullish_crossover = (
-            self._prev_ema <= self._prev_sma and 
-            self._current_ema > self._current_sma
-        )
-        
-        # Bearish: EMA was above SMA, now EMA is below SMA
-        bearish_crossover = (
-            self._prev_ema >= self._prev_sma and 
-            self._current_ema < self._current_sma
-        )
-        
-        if bullish_crossover:
+        prev_ema = self._current_ema
+        
+        # Calculate current SMA. Only called once warmed up, and the
+        # warm-up (get_required_candles) is longer than the SMA period, so
+        # the window is always full here
+        sma = self._sma_sum / self.sma_period
+        
+        # Calculate current EMA (seeded with the first price)
+        if prev_ema is None:
+            ema = price
+        else:
+            ema = (price * self._ema_multiplier) + (prev_ema * self._ema_decay)
+        
+        self._current_sma = sma
+        self._current_ema = ema
+        
+        # Which side of the SMA the EMA is on; a crossover is a change of
+        # side onto a strict one (1 or -1)
+        sign = (ema > sma) - (ema < sma)
+        prev_sign = self._prev_sign
+        self._prev_sign = sign
+        
+        # Need a previous side to detect crossover
+        if prev_sign is None or sign == prev_sign:
+            return SIGNAL_HOLD
+        
+        # Bullish: EMA was at or below SMA, now EMA is above SMA
+        if sign > 0:
             logger.info(
-                f"{self.symbol} BULLISH CROSSOVER: "
-                f"EMA({self.ema_period})={self._current_ema:.2f} > "
-                f"SMA({self.sma_period})={self._current_sma:.2f}"
+                "%s BULLISH CROSSOVER: EMA(%d)=%.2f > SMA(%d)=%.2f",
+                self.symbol, self.ema_period, ema, self.sma_period, sma
             )
-            return Signal.BUY
+            return SIGNAL_BUY
         
-        if bearish_crossover:
+        # Bearish: EMA was at or above SMA, now EMA is below SMA
+        if sign < 0:
             logger.info(
-                f"{self.symbol} BEARISH CROSSOVER: "
-                f"EMA({self.ema_period})={self._current_ema:.2f} < "
-                f"SMA({self.sma_period})={self._current_sma:.2f}"
+                "%s BEARISH CROSSOVER: EMA(%d)=%.2f < SMA(%d)=%.2f",
+                self.symbol, self.ema_period, ema, self.sma_period, sma
             )
-            return Signal.SELL
+            return SIGNAL_SELL
         
-        return Signal.HOLD
+        return SIGNAL_HOLD
     
     def get_indicators(self) -> dict:
         """
@@ -199,13 +191,20 @@ class SMAEMAStrategy(BaseStrategy):
             "ema_period": self.ema_period
         }
     
-    def reset(self) -> None:
-        """Reset the strategy state."""
-        self._prev_ema = None
-        self._prev_sma = None
+    def reset_state(self) -> None:
+        """Clear the SMA window and EMA, keeping the position."""
+        super().reset_state()
+        self._prev_sign = None
         self._current_ema = None
         self._current_sma = None
-        self.candle_history.clear()
+        self._sma_window.clear()
+        self._sma_sum = 0.0
+        self._sma_resync = self.sma_period
+    
+    def reset(self) -> None:
+        """Reset the strategy state."""
+        self.reset_state()
+        self._stop_signalled = False
         self.position.side = "FLAT"
         self.position.entry_price = 0.0
         self.position.quantity = 0.0
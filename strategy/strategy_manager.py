@@ -7,18 +7,18 @@ and coordinates their execution across symbols.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Callable, Tuple
+from typing import Dict, Iterable, List, Optional, Callable, Tuple
 import logging
 
-from aggregation.models import OHLCCandle
-from strategy.base_strategy import BaseStrategy, Signal, Position
+from aggregation.models import OHLCCandle, Tick, normalize_symbol
+from strategy.base_strategy import BaseStrategy, Signal, Position, SIGNAL_HOLD, SIGNAL_SELL
 from strategy.sma_ema_strategy import SMAEMAStrategy
 from config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyVariant:
     """
     Represents a strategy variant with specific parameters.
@@ -51,7 +51,10 @@ class StrategyManager:
     Attributes:
         variants: List of strategy variants
         strategies: Dict mapping (symbol, variant_name) to strategy instance
+        _symbol_strategies: Per symbol, (variant_name, strategy) pairs in variant order
+        _variant_slots: Index of each variant name within those pairs
         _signal_callbacks: Callbacks to notify on signal generation
+        _status: Cached get_status() result, None when stale
     """
     
     def __init__(
@@ -91,9 +94,17 @@ class StrategyManager:
             )
         ]
         
+        # Position of each variant within a symbol's strategy tuple
+        self._variant_slots: Dict[str, int] = {
+            variant.name: slot for slot, variant in enumerate(self.variants)
+        }
+        
         # Create strategies for each symbol-variant combination
         # Key: (symbol, variant_name) -> Strategy
         self.strategies: Dict[Tuple[str, str], SMAEMAStrategy] = {}
+        # Same strategies grouped by symbol, so a candle is dispatched with
+        # one lookup instead of one per variant
+        self._symbol_strategies: Dict[str, Tuple[Tuple[str, SMAEMAStrategy], ...]] = {}
         
         symbols = symbols or self.settings.symbols
         for symbol in symbols:
@@ -102,9 +113,12 @@ class StrategyManager:
         # Signal callbacks
         self._signal_callbacks: List[Callable[[str, str, Signal, float], None]] = []
         
+        # Status snapshot, rebuilt on the first poll after any state change
+        self._status: Optional[dict] = None
+        
         logger.info(
-            f"Strategy Manager initialized with {len(symbols)} symbols "
-            f"and {len(self.variants)} variants"
+            "Strategy Manager initialized with %d symbols and %d variants",
+            len(symbols), len(self.variants)
         )
     
     def _create_strategies_for_symbol(self, symbol: str) -> None:
@@ -114,7 +128,8 @@ class StrategyManager:
         Args:
             symbol: Trading symbol
         """
-        symbol = symbol.upper()
+        symbol = normalize_symbol(symbol)
+        pairs = []
         for variant in self.variants:
             key = (symbol, variant.name)
             self.strategies[key] = SMAEMAStrategy(
@@ -123,7 +138,27 @@ class StrategyManager:
                 ema_period=self.ema_period,
                 stop_loss_pct=variant.stop_loss_pct
             )
-            logger.info(f"Created strategy for {symbol} variant {variant.name}")
+            pairs.append((variant.name, self.strategies[key]))
+            logger.info("Created strategy for %s variant %s", symbol, variant.name)
+        self._symbol_strategies[symbol] = tuple(pairs)
+        self._status = None
+    
+    def _lookup(self, symbol: str, variant_name: str) -> Optional[SMAEMAStrategy]:
+        """
+        Find the strategy for a symbol-variant without building a tuple key.
+        
+        Args:
+            symbol: Trading symbol
+            variant_name: Strategy variant name
+            
+        Returns:
+            Strategy instance or None
+        """
+        pairs = self._symbol_strategies.get(symbol.upper())
+        slot = self._variant_slots.get(variant_name)
+        if pairs is None or slot is None:
+            return None
+        return pairs[slot][1]
     
     def add_symbol(self, symbol: str) -> None:
         """
@@ -133,12 +168,12 @@ class StrategyManager:
             symbol: Trading symbol to add
         """
         symbol = symbol.upper()
-        if any(s == symbol for s, _ in self.strategies.keys()):
-            logger.warning(f"Symbol {symbol} already exists")
+        if symbol in self._symbol_strategies:
+            logger.warning("Symbol %s already exists", symbol)
             return
         
         self._create_strategies_for_symbol(symbol)
-        logger.info(f"Added symbol {symbol}")
+        logger.info("Added symbol %s", symbol)
     
     def remove_symbol(self, symbol: str) -> None:
         """
@@ -148,12 +183,12 @@ class StrategyManager:
             symbol: Trading symbol to remove
         """
         symbol = symbol.upper()
-        keys_to_remove = [k for k in self.strategies.keys() if k[0] == symbol]
-        
-        for key in keys_to_remove:
-            del self.strategies[key]
+        # Only this symbol's keys, rather than a scan over every strategy
+        for variant_name, _ in self._symbol_strategies.pop(symbol, ()):
+            del self.strategies[(symbol, variant_name)]
+        self._status = None
         
-        logger.info(f"Removed symbol {symbol}")
+        logger.info("Removed symbol %s", symbol)
     
     def add_signal_callback(
         self, 
@@ -190,28 +225,92 @@ class StrategyManager:
         Returns:
             List of (symbol, variant_name, signal) tuples for actionable signals
         """
-        signals = []
-        symbol = candle.symbol.upper()
+        return self.on_candles((candle,))
+    
+    def on_candles(self, candles: Iterable[OHLCCandle]) -> List[Tuple[str, str, Signal]]:
+        """
+        Process a batch of closed candles across all strategy variants.
         
-        for variant in self.variants:
-            key = (symbol, variant.name)
-            strategy = self.strategies.get(key)
+        Candles for every symbol close at the same minute boundary, so the
+        consumer hands them over together. Dispatch state is bound once for
+        the whole batch instead of once per candle.
+        
+        Args:
+            candles: Closed OHLC candles, oldest first
+            
+        Returns:
+            List of (symbol, variant_name, signal) tuples for actionable signals
+        """
+        signals = []
+        symbol_strategies = self._symbol_strategies
+        callbacks = self._signal_callbacks
+        
+        for candle in candles:
+            # Aggregator candles are already normalized; only a miss pays
+            # for normalizing the symbol
+            symbol = candle.symbol
+            pairs = symbol_strategies.get(symbol)
+            if pairs is None:
+                symbol = normalize_symbol(symbol)
+                pairs = symbol_strategies.get(symbol, ())
+            if pairs:
+                # Prices and indicators move with every candle
+                self._status = None
             
-            if strategy:
+            for variant_name, strategy in pairs:
                 signal = strategy.on_candle(candle)
                 
-                if signal and signal != Signal.HOLD:
-                    signals.append((symbol, variant.name, signal))
+                if signal and signal is not SIGNAL_HOLD:
+                    signals.append((symbol, variant_name, signal))
                     
                     # Notify callbacks
-                    for callback in self._signal_callbacks:
+                    for callback in callbacks:
                         try:
-                            callback(symbol, variant.name, signal, candle.close)
+                            callback(symbol, variant_name, signal, candle.close)
                         except Exception as e:
-                            logger.error(f"Error in signal callback: {e}")
+                            logger.error("Error in signal callback: %s", e)
         
         return signals
     
+    def on_tick(self, tick: Tick) -> None:
+        """
+        Check open positions of the tick's symbol against its price.
+        
+        Only the stop loss is evaluated, so a stop is acted on between
+        candle closes; indicators stay on the closed-candle cadence.
+        Registered as an inline TickStore subscriber.
+        
+        Args:
+            tick: Incoming trade tick (not retained)
+        """
+        # TickStore ticks are already normalized; only a miss pays for
+        # normalizing the symbol
+        pairs = self._symbol_strategies.get(tick.symbol)
+        if pairs is None:
+            pairs = self._symbol_strategies.get(normalize_symbol(tick.symbol))
+            if pairs is None:
+                return
+        
+        price = tick.price
+        for variant_name, strategy in pairs:
+            if not strategy.is_in_position():
+                continue
+            
+            # The position's current price moves with every tick
+            self._status = None
+            if strategy.on_tick(price) is None:
+                continue
+            
+            symbol = strategy.symbol
+            logger.info(
+                "%s variant %s stop loss hit at %.2f", symbol, variant_name, price
+            )
+            for callback in self._signal_callbacks:
+                try:
+                    callback(symbol, variant_name, SIGNAL_SELL, price)
+                except Exception as e:
+                    logger.error("Error in signal callback: %s", e)
+    
     def enter_position(
         self, 
         symbol: str, 
@@ -230,18 +329,18 @@ class StrategyManager:
             quantity: Position size
             timestamp: Entry timestamp (defaults to now)
         """
-        key = (symbol.upper(), variant_name)
-        strategy = self.strategies.get(key)
+        strategy = self._lookup(symbol, variant_name)
         
         if strategy:
+            self._status = None
             strategy.enter_position(
                 price=price,
                 quantity=quantity,
                 timestamp=timestamp or datetime.utcnow()
             )
             logger.info(
-                f"Entered position for {symbol} variant {variant_name}: "
-                f"price={price:.2f}, qty={quantity}"
+                "Entered position for %s variant %s: price=%.2f, qty=%s",
+                symbol, variant_name, price, quantity
             )
     
     def exit_position(self, symbol: str, variant_name: str, price: float) -> float:
@@ -256,19 +355,32 @@ class StrategyManager:
         Returns:
             Realized P&L from the trade
         """
-        key = (symbol.upper(), variant_name)
-        strategy = self.strategies.get(key)
+        strategy = self._lookup(symbol, variant_name)
         
         if strategy:
+            self._status = None
             pnl = strategy.exit_position(price)
             logger.info(
-                f"Exited position for {symbol} variant {variant_name}: "
-                f"price={price:.2f}, P&L={pnl:.4f}"
+                "Exited position for %s variant %s: price=%.2f, P&L=%.4f",
+                symbol, variant_name, price, pnl
             )
             return pnl
         
         return 0.0
     
+    def rearm_stop_loss(self, symbol: str, variant_name: str) -> None:
+        """
+        Re-arm the stop loss of a symbol-variant after a failed exit.
+        
+        Args:
+            symbol: Trading symbol
+            variant_name: Strategy variant name
+        """
+        strategy = self._lookup(symbol, variant_name)
+        
+        if strategy:
+            strategy.rearm_stop_loss()
+    
     def get_position(self, symbol: str, variant_name: str) -> Optional[Position]:
         """
         Get position state for a specific symbol-variant.
@@ -280,8 +392,7 @@ class StrategyManager:
         Returns:
             Position object or None
         """
-        key = (symbol.upper(), variant_name)
-        strategy = self.strategies.get(key)
+        strategy = self._lookup(symbol, variant_name)
         return strategy.get_position() if strategy else None
     
     def get_all_positions(self) -> Dict[str, Dict[str, Position]]:
@@ -311,7 +422,7 @@ class StrategyManager:
         Returns:
             Strategy instance or None
         """
-        return self.strategies.get((symbol.upper(), variant_name))
+        return self._lookup(symbol, variant_name)
     
     def get_symbols(self) -> List[str]:
         """
@@ -320,7 +431,7 @@ class StrategyManager:
         Returns:
             List of symbol names
         """
-        return list(set(s for s, _ in self.strategies.keys()))
+        return list(self._symbol_strategies)
     
     def get_variants(self) -> List[StrategyVariant]:
         """
@@ -335,9 +446,16 @@ class StrategyManager:
         """
         Get comprehensive status of all strategies.
         
+        The result is cached until a candle, position change or symbol
+        change invalidates it, so repeated polls between candles do not
+        rebuild it. Callers must not modify the returned dictionary.
+        
         Returns:
             Status dictionary with all positions and indicators
         """
+        if self._status is not None:
+            return self._status
+        
         status = {
             "symbols": self.get_symbols(),
             "variants": [v.to_dict() for v in self.variants],
@@ -357,4 +475,5 @@ class StrategyManager:
                 "indicators": strategy.get_indicators()
             }
         
+        self._status = status
         return status
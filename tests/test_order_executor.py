@@ -0,0 +1,127 @@
+"""Tests for the order executor's signal ledger."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.order_executor import OrderExecutor
+from execution.trade_logger import TradeLogger
+from strategy.base_strategy import Signal
+from strategy.strategy_manager import StrategyManager
+
+
+class StubOrderClient:
+    """Order client that replays canned responses and counts orders."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.orders = 0
+    
+    async def place_market_order(self, symbol, side, quantity):
+        self.orders += 1
+        # Let duplicate signals reach the ledger while this one is in flight
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+
+class OrderExecutorLedgerTest(unittest.TestCase):
+    """Collapsing of identical signals by the ledger."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.trade_logger = TradeLogger(log_file=os.path.join(self.tmp.name, "trades.json"))
+        self.manager = StrategyManager(symbols=["BTCUSDT"])
+    
+    def tearDown(self):
+        self.trade_logger.close()
+        self.tmp.cleanup()
+    
+    def _executor(self, client):
+        return OrderExecutor(self.manager, order_client=client, trade_logger=self.trade_logger)
+    
+    def test_duplicates_collapse_into_one_order(self):
+        client = StubOrderClient({"orderId": 1, "status": "FILLED"})
+        executor = self._executor(client)
+        
+        async def run():
+            return await asyncio.gather(
+                *(executor.execute_signal("BTCUSDT", "A", Signal.BUY, 100.0) for _ in range(3))
+            )
+        
+        responses = asyncio.run(run())
+        self.assertEqual(client.orders, 1)
+        self.assertEqual([r["orderId"] for r in responses], [1, 1, 1])
+    
+    def test_failed_order_can_be_retried(self):
+        client = StubOrderClient({"code": -1013, "msg": "rejected"}, {"orderId": 2})
+        executor = self._executor(client)
+        
+        async def run():
+            first = await executor.execute_signal("BTCUSDT", "A", Signal.BUY, 100.0)
+            second = await executor.execute_signal("BTCUSDT", "A", Signal.BUY, 100.0)
+            return first, second
+        
+        first, second = asyncio.run(run())
+        self.assertNotIn("orderId", first)
+        self.assertEqual(second["orderId"], 2)
+        self.assertEqual(client.orders, 2)
+    
+    def test_placed_order_stays_in_ledger_when_recording_fails(self):
+        client = StubOrderClient({"orderId": 3}, {"orderId": 4})
+        executor = self._executor(client)
+        
+        def fail(**kwargs):
+            raise RuntimeError("disk full")
+        self.trade_logger.log_trade = fail
+        
+        async def run():
+            with self.assertRaises(RuntimeError):
+                await executor.execute_signal("BTCUSDT", "A", Signal.BUY, 100.0)
+            return await executor.execute_signal("BTCUSDT", "A", Signal.BUY, 100.0)
+        
+        duplicate = asyncio.run(run())
+        self.assertEqual(duplicate["orderId"], 3)
+        self.assertEqual(client.orders, 1)
+
+
+
+class OrderExecutorStopLossTest(unittest.TestCase):
+    """Stop-loss exits that place no order."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.trade_logger = TradeLogger(log_file=os.path.join(self.tmp.name, "trades.json"))
+        self.manager = StrategyManager(symbols=["BTCUSDT"])
+        self.manager.enter_position("BTCUSDT", "A", price=100.0, quantity=0.001)
+        self.strategy = self.manager.get_strategy("BTCUSDT", "A")
+    
+    def tearDown(self):
+        self.trade_logger.close()
+        self.tmp.cleanup()
+    
+    def test_failed_exit_rearms_the_stop(self):
+        client = StubOrderClient({"code": -2010, "msg": "insufficient balance"}, {"orderId": 5})
+        executor = OrderExecutor(self.manager, order_client=client, trade_logger=self.trade_logger)
+        stop = self.strategy.position.stop_loss_price
+        
+        self.assertEqual(self.strategy.on_tick(stop - 1), Signal.SELL)
+        self.assertIsNone(self.strategy.on_tick(stop - 2))
+        
+        response = asyncio.run(executor.execute_signal("BTCUSDT", "A", Signal.SELL, stop - 1))
+        self.assertNotIn("orderId", response)
+        self.assertTrue(self.strategy.is_in_position())
+        
+        # The next price below the stop signals the exit again
+        self.assertEqual(self.strategy.on_tick(stop - 2), Signal.SELL)
+        response = asyncio.run(executor.execute_signal("BTCUSDT", "A", Signal.SELL, stop - 2))
+        self.assertEqual(response["orderId"], 5)
+        self.assertFalse(self.strategy.is_in_position())
+
+
+
+if __name__ == "__main__":
+    unittest.main()
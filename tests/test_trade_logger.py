@@ -0,0 +1,65 @@
+"""Tests for the trade logger's history queries."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execution.trade_logger import TradeLogger
+
+
+class TradeLoggerRotationTest(unittest.TestCase):
+    """Queries right after the active log file has been rotated."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.logger = TradeLogger(
+            log_file=os.path.join(self.tmp.name, "trades.json"), hot_window=3
+        )
+        self.logger.max_bytes = 600
+    
+    def tearDown(self):
+        self.logger.close()
+        self.tmp.cleanup()
+    
+    def _log(self, count):
+        for i in range(count):
+            self.logger.log_trade(
+                symbol="BTCUSDT",
+                side="BUY" if i % 2 == 0 else "SELL",
+                size=0.001,
+                price=100.0 + i,
+                variant="A"
+            )
+        self.logger.flush()
+    
+    def test_rotation_keeps_in_memory_trades(self):
+        self._log(60)
+        
+        newest = [100.0 + i for i in range(57, 60)]
+        self.assertEqual([t["price"] for t in self.logger.get_trades()], newest)
+        self.assertEqual(
+            [t["price"] for t in self.logger.get_trades(limit=50)], newest
+        )
+        self.assertEqual(
+            [t["price"] for t in self.logger.get_trades(symbol="BTCUSDT", variant="A")],
+            newest
+        )
+    
+    def test_scan_reads_older_trades_from_active_file(self):
+        self.logger.max_bytes = 0
+        self._log(10)
+        
+        trades = self.logger.get_trades(limit=5)
+        self.assertEqual([t["price"] for t in trades], [105.0, 106.0, 107.0, 108.0, 109.0])
+        self.assertEqual(len(self.logger.get_trades(side="BUY")), 5)
+        
+        trades = asyncio.run(self.logger.get_trades_async(limit=5))
+        self.assertEqual([t["price"] for t in trades], [105.0, 106.0, 107.0, 108.0, 109.0])
+
+
+if __name__ == "__main__":
+    unittest.main()